@@ -2,17 +2,206 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
-from homeassistant.config_entries import ConfigEntry
+import voluptuous as vol
+
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_LATITUDE, CONF_LONGITUDE, DOMAIN
-from .coordinator import OpenMeteoDataUpdateCoordinator
+from .api import async_get_client, build_forecast_params, resolve_url
+from .const import (
+    API_URL,
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_ALERT_RULES,
+    CONF_BASE_URL,
+    CONF_DAILY_LIMIT,
+    CONF_EXTRA_SOURCES,
+    CONF_FORECAST_DAYS,
+    CONF_HIGH_RESOLUTION,
+    CONF_LATITUDE,
+    CONF_LOCATIONS,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_LONGITUDE,
+    CONF_LOW_FOOTPRINT,
+    CONF_METRICS,
+    CONF_MINUTE_LIMIT,
+    CONF_NAME,
+    CONF_REFRESH_HOURS,
+    CONF_RESPONSE_CACHE,
+    DEFAULT_DAILY_LIMIT,
+    DEFAULT_FORECAST_DAYS,
+    DEFAULT_HIGH_RESOLUTION,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_LOW_FOOTPRINT,
+    DEFAULT_MINUTE_LIMIT,
+    DEFAULT_NAME,
+    DEFAULT_REFRESH_HOURS,
+    DEFAULT_RESPONSE_CACHE,
+    DOMAIN,
+    SENSOR_TYPES,
+    SERVICE_GET_MINUTELY_15_FORECAST,
+    SIGNAL_OPTIONS_UPDATED,
+)
+from .coordinator import OpenMeteoDataUpdateCoordinator, OpenMeteoMinutelyCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR, Platform.WEATHER]
+
+LOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
+        vol.Required(CONF_LATITUDE): cv.latitude,
+        vol.Required(CONF_LONGITUDE): cv.longitude,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_LOCATIONS, default=[]): vol.All(
+                    cv.ensure_list, [LOCATION_SCHEMA]
+                ),
+                vol.Optional(
+                    CONF_DAILY_LIMIT, default=DEFAULT_DAILY_LIMIT
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_MINUTE_LIMIT, default=DEFAULT_MINUTE_LIMIT
+                ): cv.positive_int,
+                vol.Optional(CONF_BASE_URL): cv.url,
+                vol.Optional(
+                    CONF_RESPONSE_CACHE, default=DEFAULT_RESPONSE_CACHE
+                ): cv.boolean,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+SERVICE_GET_MINUTELY_15_FORECAST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Open-Meteo CloudCover services."""
+
+    async def async_get_minutely_15_forecast(call: ServiceCall) -> ServiceResponse:
+        """Return the 15-minute forecast series for a config entry."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        coordinator: OpenMeteoDataUpdateCoordinator | None = hass.data.get(
+            DOMAIN, {}
+        ).get(entry_id)
+
+        if coordinator is None:
+            raise ServiceValidationError(f"Config entry {entry_id} is not loaded")
+        if coordinator.minutely is None or not coordinator.minutely.data:
+            raise ServiceValidationError(
+                f"High resolution mode is not enabled for config entry {entry_id}"
+            )
+
+        series = coordinator.minutely.data["_series"]
+        forecast = []
+        for row in series.rows(start=dt_util.utcnow().timestamp()):
+            timestamp = row.pop("timestamp")
+            row["datetime"] = dt_util.as_local(
+                dt_util.utc_from_timestamp(timestamp)
+            ).isoformat()
+            forecast.append(row)
+
+        return {"forecast": forecast}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MINUTELY_15_FORECAST,
+        async_get_minutely_15_forecast,
+        schema=SERVICE_GET_MINUTELY_15_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    if DOMAIN in config:
+        client = async_get_client(hass)
+        client.budget.async_set_limits(
+            config[DOMAIN][CONF_DAILY_LIMIT], config[DOMAIN][CONF_MINUTE_LIMIT]
+        )
+        client.base_url = config[DOMAIN].get(CONF_BASE_URL)
+        if config[DOMAIN][CONF_RESPONSE_CACHE]:
+            client.async_enable_cache()
+        # Validation is a network request, so keep it out of bootstrap
+        hass.async_create_background_task(
+            async_import_locations(hass, config[DOMAIN][CONF_LOCATIONS]),
+            f"{DOMAIN}_import_locations",
+        )
+
+    return True
+
+
+async def async_import_locations(
+    hass: HomeAssistant, locations: list[dict[str, Any]]
+) -> None:
+    """Import locations from configuration.yaml as config entries.
+
+    All new locations are validated with a single batched API request. Each
+    location's result seeds the first refresh of the entry it creates.
+    """
+    configured = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    locations = [
+        location
+        for location in locations
+        if f"{location[CONF_LATITUDE]}_{location[CONF_LONGITUDE]}" not in configured
+    ]
+    if not locations:
+        return
+
+    client = async_get_client(hass)
+    url = resolve_url(API_URL, client.base_url)
+    params = build_forecast_params(
+        None,
+        None,
+        DEFAULT_FORECAST_DAYS,
+        dt_util.now(),
+        str(hass.config.time_zone),
+    )
+    coordinates = [
+        (location[CONF_LATITUDE], location[CONF_LONGITUDE]) for location in locations
+    ]
+
+    try:
+        results = await client.async_fetch_locations(url, params, coordinates)
+    except Exception as err:  # pylint: disable=broad-except
+        # Entries are still created and will fetch on their own first refresh
+        _LOGGER.warning("Unable to validate imported locations: %s", err)
+    else:
+        for (latitude, longitude), raw in zip(coordinates, results):
+            client.async_seed(
+                url,
+                {**params, CONF_LATITUDE: latitude, CONF_LONGITUDE: longitude},
+                raw,
+            )
+
+    for location in locations:
+        hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=location
+            )
+        )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -24,11 +213,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         latitude=latitude,
         longitude=longitude,
+        location_name=entry.data.get(CONF_NAME, DEFAULT_NAME),
+        forecast_days=entry.options.get(CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS),
+        entry_id=entry.entry_id,
+        long_term_statistics=entry.options.get(
+            CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+        ),
+        low_footprint=entry.options.get(CONF_LOW_FOOTPRINT, DEFAULT_LOW_FOOTPRINT),
+        alert_rules=entry.options.get(CONF_ALERT_RULES, []),
+        sources=entry.options.get(CONF_EXTRA_SOURCES, []),
+        base_url=entry.options.get(CONF_BASE_URL),
+        metrics=entry.options.get(CONF_METRICS, list(SENSOR_TYPES)),
+        refresh_hours=entry.options.get(CONF_REFRESH_HOURS, DEFAULT_REFRESH_HOURS),
     )
 
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
+    # Hour-relative values follow the clock between forecast refreshes
+    entry.async_on_unload(coordinator.async_start_hour_tick())
+
+    # Extra sources refresh between forecast refreshes on their own cadence
+    if (unsub_sources := coordinator.async_start_sources()) is not None:
+        entry.async_on_unload(unsub_sources)
+
+    # High resolution mode polls a short 15-minute horizon on its own schedule
+    if entry.options.get(CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION):
+        coordinator.minutely = OpenMeteoMinutelyCoordinator(
+            hass,
+            latitude=latitude,
+            longitude=longitude,
+            low_footprint=coordinator.low_footprint,
+            base_url=coordinator.base_url,
+        )
+        await coordinator.minutely.async_config_entry_first_refresh()
+
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -36,9 +255,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Apply option changes live where possible
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     return True
 
 
+def _needs_reload(
+    hass: HomeAssistant,
+    coordinator: OpenMeteoDataUpdateCoordinator,
+    entry: ConfigEntry,
+) -> bool:
+    """Return True if the entry changed in ways only a reload can apply."""
+    base_url = entry.options.get(CONF_BASE_URL) or async_get_client(hass).base_url
+    return (
+        entry.data[CONF_LATITUDE] != coordinator.latitude
+        or entry.data[CONF_LONGITUDE] != coordinator.longitude
+        or entry.data.get(CONF_NAME, DEFAULT_NAME) != coordinator.location_name
+        or entry.options.get(CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION)
+        != (coordinator.minutely is not None)
+        or set(entry.options.get(CONF_EXTRA_SOURCES, []))
+        != {source.key for source in coordinator.sources}
+        or base_url != coordinator.base_url
+    )
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options to a loaded entry.
+
+    Location, endpoint and data source changes reload the entry. Everything
+    else reconfigures the coordinator in place, and the platforms only add or
+    remove the entities affected by the change.
+    """
+    coordinator: OpenMeteoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    if _needs_reload(hass, coordinator, entry):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    await coordinator.async_reconfigure(
+        forecast_days=entry.options.get(CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS),
+        metrics=entry.options.get(CONF_METRICS, list(SENSOR_TYPES)),
+        refresh_hours=entry.options.get(CONF_REFRESH_HOURS, DEFAULT_REFRESH_HOURS),
+        long_term_statistics=entry.options.get(
+            CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+        ),
+        low_footprint=entry.options.get(CONF_LOW_FOOTPRINT, DEFAULT_LOW_FOOTPRINT),
+        alert_rules=entry.options.get(CONF_ALERT_RULES, []),
+    )
+    async_dispatcher_send(hass, f"{SIGNAL_OPTIONS_UPDATED}_{entry.entry_id}")
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
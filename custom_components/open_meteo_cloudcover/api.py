@@ -0,0 +1,333 @@
+"""Open-Meteo API client for Open-Meteo CloudCover integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+import json
+import logging
+import math
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import async_timeout
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    BUDGET_RESERVE,
+    DATA_CLIENT,
+    DEFAULT_DAILY_LIMIT,
+    DEFAULT_MINUTE_LIMIT,
+    SEED_MAX_AGE,
+    SENSOR_TYPES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def check_coordinates(latitude: float, longitude: float) -> None:
+    """Raise ValueError if the coordinates are out of range."""
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise ValueError(f"Coordinates out of range: {latitude}, {longitude}")
+
+
+def build_forecast_params(
+    latitude: float | str,
+    longitude: float | str,
+    forecast_days: int,
+    now: datetime,
+    timezone: str,
+    metrics: list[str] | None = None,
+) -> dict[str, Any]:
+    """Build the hourly forecast request parameters."""
+    # Calculate date range: from today to forecast_days in the future
+    start_date = now.strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=forecast_days)).strftime("%Y-%m-%d")
+    metrics = metrics or list(SENSOR_TYPES)
+
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "start_date": start_date,
+        "end_date": end_date,
+        "timezone": timezone,  # Date range is in HA timezone
+        "timeformat": "unixtime",  # Timestamps as UTC epoch seconds
+        # Metrics in a fixed order so equal requests share one key
+        "hourly": ",".join(
+            [*(metric for metric in SENSOR_TYPES if metric in metrics), "is_day"]
+        ),
+    }
+
+
+def resolve_url(url: str, base_url: str | None) -> str:
+    """Return ``url`` served from ``base_url`` when one is configured.
+
+    The endpoint path is kept, so a self-hosted instance or caching proxy
+    only needs to mirror the public API's paths.
+    """
+    if not base_url:
+        return url
+    return base_url.rstrip("/") + urlsplit(url).path
+
+
+def cache_max_age(cache_control: str | None) -> int | None:
+    """Return the max-age of a Cache-Control header, if it allows caching."""
+    if not cache_control:
+        return None
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    if "no-store" in directives or "no-cache" in directives:
+        return None
+    try:
+        max_age = int(directives["max-age"])
+    except (KeyError, ValueError):
+        return None
+    return max_age if max_age > 0 else None
+
+
+def params_key(url: str, params: dict[str, Any]) -> tuple[Any, ...]:
+    """Return a hashable key identifying a request."""
+    return (url, *sorted((key, str(value)) for key, value in params.items()))
+
+
+def request_cost(params: dict[str, Any]) -> float:
+    """Return the number of API calls Open-Meteo counts for a request.
+
+    Open-Meteo counts one call per location for up to 10 variables and
+    2 weeks of data, scaling fractionally beyond that.
+    """
+    locations = str(params.get("latitude", "")).count(",") + 1
+    variables = sum(
+        len(str(params[block]).split(","))
+        for block in ("hourly", "minutely_15", "daily")
+        if params.get(block)
+    )
+    if "start_date" in params and "end_date" in params:
+        days = (
+            date.fromisoformat(params["end_date"])
+            - date.fromisoformat(params["start_date"])
+        ).days + 1
+    elif "forecast_minutely_15" in params:
+        days = math.ceil(int(params["forecast_minutely_15"]) / 96)
+    else:
+        days = int(params.get("forecast_days", 7))
+    return locations * max(1.0, variables / 10) * max(1.0, days / 14)
+
+
+class BudgetExhausted(Exception):
+    """Error to indicate the API call budget cannot cover a request."""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to its capacity."""
+
+    def __init__(self, capacity: float, period: float) -> None:
+        """Initialize a full bucket refilled over ``period`` seconds."""
+        self.capacity = capacity
+        self.period = period
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """Return the tokens currently available."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.capacity / self.period,
+        )
+        self._updated = now
+        return self._tokens
+
+    def consume(self, cost: float) -> None:
+        """Remove ``cost`` tokens from the bucket."""
+        self._tokens = self.tokens - cost
+
+
+class RequestBudget:
+    """Domain-wide API call budget with daily and per-minute quotas."""
+
+    def __init__(
+        self,
+        daily_limit: int = DEFAULT_DAILY_LIMIT,
+        minute_limit: int = DEFAULT_MINUTE_LIMIT,
+    ) -> None:
+        """Initialize the budget."""
+        self.daily = TokenBucket(daily_limit, 86400)
+        self.minute = TokenBucket(minute_limit, 60)
+        self.spent = 0.0
+        self.deferred = 0
+
+    @callback
+    def async_set_limits(self, daily_limit: int, minute_limit: int) -> None:
+        """Apply the quotas configured for this deployment."""
+        self.daily = TokenBucket(daily_limit, 86400)
+        self.minute = TokenBucket(minute_limit, 60)
+
+    @callback
+    def async_spend(self, cost: float, urgent: bool) -> None:
+        """Spend ``cost`` calls or raise BudgetExhausted.
+
+        Non-urgent requests must leave a reserve of each quota for urgent
+        ones such as setup, validation and manual refreshes.
+        """
+        reserve = 0.0 if urgent else BUDGET_RESERVE
+        for bucket in (self.daily, self.minute):
+            if bucket.tokens - cost < bucket.capacity * reserve:
+                if not urgent:
+                    self.deferred += 1
+                raise BudgetExhausted(
+                    f"API budget too low for request costing {cost:.2f} calls"
+                )
+        self.daily.consume(cost)
+        self.minute.consume(cost)
+        self.spent += cost
+
+
+class OpenMeteoClient:
+    """Client shared by all Open-Meteo CloudCover config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the client."""
+        self._hass = hass
+        self._session = async_get_clientsession(hass)
+        self.budget = RequestBudget()
+        # Self-hosted instance or proxy used instead of the public API
+        self.base_url: str | None = None
+        # Responses fetched during validation, reused by the first refresh
+        self._seeds: dict[tuple[Any, ...], tuple[float, bytes]] = {}
+        # Responses kept until their Cache-Control max-age, when enabled
+        self._cache: dict[tuple[Any, ...], tuple[float, bytes]] | None = None
+        self.cache_hits = 0
+        # Requests in flight, shared by concurrent callers with the same key
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[bytes]] = {}
+        self.coalesced = 0
+
+    @callback
+    def async_enable_cache(self) -> None:
+        """Cache responses for as long as the server allows."""
+        if self._cache is None:
+            self._cache = {}
+
+    async def async_fetch(
+        self,
+        url: str,
+        params: dict[str, Any],
+        timeout: int = 30,
+        urgent: bool = True,
+    ) -> bytes:
+        """Fetch a response body from the API or the response cache."""
+        key = params_key(url, params)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.cache_hits += 1
+                return cached[1]
+
+        # Join an identical request that is already in flight
+        if (inflight := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[bytes] = self._hass.loop.create_future()
+        self._inflight[key] = future
+        try:
+            self.budget.async_spend(request_cost(params), urgent)
+            async with async_timeout.timeout(timeout):
+                async with self._session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    raw = await response.read()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Mark the error retrieved, as there may be no other waiters
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+        future.set_result(raw)
+        if self._cache is not None:
+            max_age = cache_max_age(response.headers.get("Cache-Control"))
+            self._async_store(key, raw, max_age)
+        return raw
+
+    @callback
+    def _async_store(
+        self, key: tuple[Any, ...], raw: bytes, max_age: int | None
+    ) -> None:
+        """Store a response in the cache until it expires."""
+        now = time.monotonic()
+        # Drop expired responses so the cache only holds live entries
+        for expired in [
+            cached_key
+            for cached_key, (expires_at, _) in self._cache.items()
+            if expires_at <= now
+        ]:
+            del self._cache[expired]
+        if max_age is not None:
+            self._cache[key] = (now + max_age, raw)
+
+    async def async_fetch_locations(
+        self,
+        url: str,
+        params: dict[str, Any],
+        locations: list[tuple[float, float]],
+        timeout: int = 30,
+    ) -> list[bytes]:
+        """Fetch several locations in one request and split the response.
+
+        Open-Meteo accepts comma separated coordinates and returns a list of
+        results in the same order. Each result is re-encoded on its own so it
+        can be handled exactly like a single location response.
+        """
+        batch_params = {
+            **params,
+            "latitude": ",".join(str(latitude) for latitude, _ in locations),
+            "longitude": ",".join(str(longitude) for _, longitude in locations),
+        }
+        data = json.loads(await self.async_fetch(url, batch_params, timeout))
+        if isinstance(data, dict):
+            data = [data]
+        if len(data) != len(locations):
+            raise ValueError("Unexpected number of locations in API response")
+        return [json.dumps(result).encode() for result in data]
+
+    @callback
+    def async_seed(self, url: str, params: dict[str, Any], raw: bytes) -> None:
+        """Store a response to be reused by an identical request."""
+        now = time.monotonic()
+        # Drop seeds that were never claimed, e.g. from an aborted flow
+        for key in [
+            key
+            for key, (seeded_at, _) in self._seeds.items()
+            if now - seeded_at > SEED_MAX_AGE
+        ]:
+            del self._seeds[key]
+        self._seeds[params_key(url, params)] = (now, raw)
+
+    @callback
+    def async_pop_seed(self, url: str, params: dict[str, Any]) -> bytes | None:
+        """Return and forget a fresh seeded response for a request."""
+        seed = self._seeds.pop(params_key(url, params), None)
+        if seed is None:
+            return None
+        seeded_at, raw = seed
+        if time.monotonic() - seeded_at > SEED_MAX_AGE:
+            return None
+        _LOGGER.debug("Using validation response as initial data")
+        return raw
+
+
+@callback
+def async_get_client(hass: HomeAssistant) -> OpenMeteoClient:
+    """Return the shared Open-Meteo client, creating it if needed."""
+    if DATA_CLIENT not in hass.data:
+        hass.data[DATA_CLIENT] = OpenMeteoClient(hass)
+    return hass.data[DATA_CLIENT]
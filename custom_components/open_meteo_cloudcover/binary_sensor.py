@@ -0,0 +1,119 @@
+"""Binary sensor platform for Open-Meteo CloudCover integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    DOMAIN as BINARY_SENSOR_DOMAIN,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_OPTIONS_UPDATED
+from .coordinator import OpenMeteoDataUpdateCoordinator
+from .entity import device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Open-Meteo CloudCover alert binary sensors."""
+    coordinator: OpenMeteoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    rule_ids = {rule["id"] for rule in coordinator.alert_rules}
+    async_add_entities(
+        OpenMeteoAlertBinarySensor(coordinator=coordinator, entry=entry, rule=rule)
+        for rule in coordinator.alert_rules
+    )
+
+    @callback
+    def _async_options_updated() -> None:
+        """Add and remove only the binary sensors of changed alert rules."""
+        wanted = {rule["id"]: rule for rule in coordinator.alert_rules}
+
+        registry = er.async_get(hass)
+        for rule_id in rule_ids - wanted.keys():
+            entity_id = registry.async_get_entity_id(
+                BINARY_SENSOR_DOMAIN, DOMAIN, f"{entry.entry_id}_alert_{rule_id}"
+            )
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+
+        new_rules = [rule for rule_id, rule in wanted.items() if rule_id not in rule_ids]
+        rule_ids.clear()
+        rule_ids.update(wanted)
+        if new_rules:
+            async_add_entities(
+                OpenMeteoAlertBinarySensor(coordinator=coordinator, entry=entry, rule=rule)
+                for rule in new_rules
+            )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_OPTIONS_UPDATED}_{entry.entry_id}", _async_options_updated
+        )
+    )
+
+
+class OpenMeteoAlertBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor that is on while a threshold rule is crossed in its window."""
+
+    _attr_icon = "mdi:bell-ring-outline"
+
+    def __init__(
+        self,
+        coordinator: OpenMeteoDataUpdateCoordinator,
+        entry: ConfigEntry,
+        rule: dict[str, Any],
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+
+        self._rule = rule
+        self._attr_name = rule["name"]
+        self._attr_unique_id = f"{entry.entry_id}_alert_{rule['id']}"
+        self._attr_device_info = device_info(entry)
+
+    @property
+    def _alert(self) -> dict[str, Any]:
+        """Return the coordinator's evaluation of this rule."""
+        return (self.coordinator.data or {}).get("_alerts", {}).get(self._rule["id"], {})
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the threshold is crossed within the window."""
+        series = (self.coordinator.data or {}).get("_series")
+        # Unknown rather than off while the rule's metric is not fetched
+        if series is None or self._rule["metric"] not in series.columns:
+            return None
+        if not self._alert:
+            return None
+        return self._alert.get("first_crossing") is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        first_crossing = self._alert.get("first_crossing")
+        return {
+            "metric": self._rule["metric"],
+            "comparison": self._rule["comparison"],
+            "threshold": self._rule["threshold"],
+            "window_hours": self._rule["window_hours"],
+            "first_crossing": dt_util.as_local(
+                dt_util.utc_from_timestamp(first_crossing)
+            ).isoformat()
+            if first_crossing is not None
+            else None,
+            "value": self._alert.get("value"),
+        }
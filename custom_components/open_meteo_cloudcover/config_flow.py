@@ -1,50 +1,105 @@
 """Config flow for Open-Meteo CloudCover integration."""
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
+import uuid
 
 import aiohttp
-import async_timeout
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    async_get_client,
+    build_forecast_params,
+    check_coordinates,
+    resolve_url,
+)
 from .const import (
     API_URL,
+    COMPARISON_ABOVE,
+    COMPARISON_BELOW,
+    CONF_ALERT_RULES,
+    CONF_BASE_URL,
+    CONF_COMPARISON,
+    CONF_EXTRA_SOURCES,
+    CONF_FORECAST_ATTRIBUTES,
+    CONF_FORECAST_DAYS,
+    CONF_HIGH_RESOLUTION,
+    CONF_HOURLY_SENSORS,
     CONF_LATITUDE,
+    CONF_LONG_TERM_STATISTICS,
     CONF_LONGITUDE,
+    CONF_LOW_FOOTPRINT,
+    CONF_METRIC,
+    CONF_METRICS,
     CONF_NAME,
+    CONF_REFRESH_HOURS,
+    CONF_REMOVE_ALERTS,
+    CONF_THRESHOLD,
+    CONF_WINDOW_HOURS,
+    DEFAULT_FORECAST_ATTRIBUTES,
+    DEFAULT_FORECAST_DAYS,
+    DEFAULT_HIGH_RESOLUTION,
+    DEFAULT_HOURLY_SENSORS,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_LOW_FOOTPRINT,
     DEFAULT_NAME,
+    DEFAULT_REFRESH_HOURS,
+    DEFAULT_WINDOW_HOURS,
     DOMAIN,
+    MAX_FORECAST_DAYS,
+    MAX_HOURLY_SENSORS,
+    MAX_REFRESH_HOURS,
+    MAX_WINDOW_HOURS,
+    MIN_FORECAST_DAYS,
+    SENSOR_TYPES,
 )
+from .sources import SOURCES
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def validate_coordinates(
-    hass: HomeAssistant, latitude: float, longitude: float
-) -> dict[str, Any]:
-    """Validate the coordinates by making a test API call."""
-    params = {
-        "latitude": latitude,
-        "longitude": longitude,
-        "hourly": "cloud_cover",
-    }
+    hass: HomeAssistant,
+    latitude: float,
+    longitude: float,
+    base_url: str | None = None,
+    forecast_days: int = DEFAULT_FORECAST_DAYS,
+    metrics: list[str] | None = None,
+) -> bool:
+    """Validate the coordinates by fetching the initial forecast.
+
+    The response is kept so the first coordinator refresh can reuse it
+    instead of fetching the same forecast again, so the request must match
+    the entry's forecast days and metrics.
+    """
+    # Reject out-of-range coordinates without a request
+    check_coordinates(latitude, longitude)
+
+    client = async_get_client(hass)
+    url = resolve_url(API_URL, base_url or client.base_url)
+    params = build_forecast_params(
+        latitude,
+        longitude,
+        forecast_days,
+        dt_util.now(),
+        str(hass.config.time_zone),
+        metrics,
+    )
 
     try:
-        async with async_timeout.timeout(10):
-            async with aiohttp.ClientSession() as session:
-                async with session.get(API_URL, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    if "hourly" not in data:
-                        raise ValueError("Invalid response from API")
+        raw = await client.async_fetch(url, params, timeout=10)
+        data = json.loads(raw)
 
-                    return True
+        if "hourly" not in data:
+            raise ValueError("Invalid response from API")
 
     except aiohttp.ClientError:
         raise CannotConnect
@@ -52,6 +107,9 @@ async def validate_coordinates(
         _LOGGER.exception("Unexpected exception: %s", err)
         raise UnknownError from err
 
+    client.async_seed(url, params, raw)
+    return True
+
 
 class OpenMeteoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Open-Meteo CloudCover."""
@@ -66,6 +124,33 @@ class OpenMeteoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return OpenMeteoOptionsFlowHandler(config_entry)
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Handle a location imported from configuration.yaml.
+
+        Imported locations are validated in one batched request during
+        setup, so only the local range check is repeated here.
+        """
+        try:
+            check_coordinates(import_data[CONF_LATITUDE], import_data[CONF_LONGITUDE])
+        except ValueError:
+            return self.async_abort(reason="invalid_coords")
+
+        await self.async_set_unique_id(
+            f"{import_data[CONF_LATITUDE]}_{import_data[CONF_LONGITUDE]}"
+        )
+        self._abort_if_unique_id_configured()
+
+        location_name = import_data.get(CONF_NAME, DEFAULT_NAME)
+
+        return self.async_create_entry(
+            title=location_name,
+            data={
+                CONF_NAME: location_name,
+                CONF_LATITUDE: import_data[CONF_LATITUDE],
+                CONF_LONGITUDE: import_data[CONF_LONGITUDE],
+            },
+        )
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -74,18 +159,18 @@ class OpenMeteoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
+                # Check if already configured before fetching anything
+                await self.async_set_unique_id(
+                    f"{user_input[CONF_LATITUDE]}_{user_input[CONF_LONGITUDE]}"
+                )
+                self._abort_if_unique_id_configured()
+
                 await validate_coordinates(
                     self.hass,
                     user_input[CONF_LATITUDE],
                     user_input[CONF_LONGITUDE],
                 )
 
-                # Check if already configured
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_LATITUDE]}_{user_input[CONF_LONGITUDE]}"
-                )
-                self._abort_if_unique_id_configured()
-
                 # Use location name for the title
                 location_name = user_input.get(CONF_NAME, DEFAULT_NAME)
 
@@ -134,6 +219,162 @@ class OpenMeteoOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        menu_options = ["location", "sensors", "add_alert"]
+        if self.config_entry.options.get(CONF_ALERT_RULES):
+            menu_options.append("remove_alert")
+
+        return self.async_show_menu(step_id="init", menu_options=menu_options)
+
+    async def _async_save_options(self, options: dict[str, Any]) -> FlowResult:
+        """Save new options; the entry's update listener applies them."""
+        return self.async_create_entry(title="", data=options)
+
+    async def async_step_sensors(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the forecast horizon, metrics and refresh interval."""
+        errors: dict[str, str] = {}
+        options = self.config_entry.options
+
+        if user_input is not None:
+            metrics = user_input[CONF_METRICS]
+            # The weather entity and alert rules read their metric's column
+            if "cloud_cover" not in metrics:
+                errors["base"] = "cloud_cover_required"
+            elif any(
+                rule[CONF_METRIC] not in metrics
+                for rule in options.get(CONF_ALERT_RULES, [])
+            ):
+                errors["base"] = "metric_in_use"
+            else:
+                return await self._async_save_options({**options, **user_input})
+
+        options = {**options, **(user_input or {})}
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_FORECAST_DAYS,
+                    default=options.get(CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_FORECAST_DAYS, max=MAX_FORECAST_DAYS),
+                ),
+                vol.Required(
+                    CONF_METRICS,
+                    default=options.get(CONF_METRICS, list(SENSOR_TYPES)),
+                ): vol.All(
+                    cv.multi_select(
+                        {metric: info["name"] for metric, info in SENSOR_TYPES.items()}
+                    ),
+                    vol.Length(min=1),
+                ),
+                vol.Required(
+                    CONF_HOURLY_SENSORS,
+                    default=options.get(CONF_HOURLY_SENSORS, DEFAULT_HOURLY_SENSORS),
+                ): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=MAX_HOURLY_SENSORS)
+                ),
+                vol.Required(
+                    CONF_REFRESH_HOURS,
+                    default=options.get(CONF_REFRESH_HOURS, DEFAULT_REFRESH_HOURS),
+                ): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=MAX_REFRESH_HOURS)
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="sensors", data_schema=data_schema, errors=errors
+        )
+
+    async def async_step_add_alert(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a threshold alert rule."""
+        if user_input is not None:
+            metric = user_input[CONF_METRIC]
+            comparison = user_input[CONF_COMPARISON]
+            threshold = user_input[CONF_THRESHOLD]
+            window_hours = user_input[CONF_WINDOW_HOURS]
+            name = user_input.get(CONF_NAME) or (
+                f"{SENSOR_TYPES[metric]['name']} {comparison} {threshold:g} "
+                f"within {window_hours}h"
+            )
+
+            rule = {
+                "id": uuid.uuid4().hex,
+                CONF_NAME: name,
+                CONF_METRIC: metric,
+                CONF_COMPARISON: comparison,
+                CONF_THRESHOLD: threshold,
+                CONF_WINDOW_HOURS: window_hours,
+            }
+
+            return await self._async_save_options(
+                {
+                    **self.config_entry.options,
+                    CONF_ALERT_RULES: [
+                        *self.config_entry.options.get(CONF_ALERT_RULES, []),
+                        rule,
+                    ],
+                }
+            )
+
+        # Only fetched metrics can be alerted on
+        metrics = self.config_entry.options.get(CONF_METRICS, list(SENSOR_TYPES))
+        data_schema = vol.Schema(
+            {
+                vol.Optional(CONF_NAME): str,
+                vol.Required(CONF_METRIC, default="cloud_cover"): vol.In(
+                    {
+                        metric: info["name"]
+                        for metric, info in SENSOR_TYPES.items()
+                        if metric in metrics
+                    }
+                ),
+                vol.Required(CONF_COMPARISON, default=COMPARISON_BELOW): vol.In(
+                    [COMPARISON_BELOW, COMPARISON_ABOVE]
+                ),
+                vol.Required(CONF_THRESHOLD): vol.Coerce(float),
+                vol.Required(CONF_WINDOW_HOURS, default=DEFAULT_WINDOW_HOURS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=MAX_WINDOW_HOURS)
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="add_alert", data_schema=data_schema)
+
+    async def async_step_remove_alert(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Remove threshold alert rules."""
+        rules = self.config_entry.options.get(CONF_ALERT_RULES, [])
+
+        if user_input is not None:
+            removed = set(user_input[CONF_REMOVE_ALERTS])
+            return await self._async_save_options(
+                {
+                    **self.config_entry.options,
+                    CONF_ALERT_RULES: [
+                        rule for rule in rules if rule["id"] not in removed
+                    ],
+                }
+            )
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_REMOVE_ALERTS, default=[]): cv.multi_select(
+                    {rule["id"]: rule[CONF_NAME] for rule in rules}
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="remove_alert", data_schema=data_schema)
+
+    async def async_step_location(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the location and data options."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -144,12 +385,38 @@ class OpenMeteoOptionsFlowHandler(config_entries.OptionsFlow):
                 old_lat = self.config_entry.data[CONF_LATITUDE]
                 old_lon = self.config_entry.data[CONF_LONGITUDE]
 
-                if new_lat != old_lat or new_lon != old_lon:
-                    await validate_coordinates(self.hass, new_lat, new_lon)
+                # An empty base URL falls back to the domain-wide endpoint
+                base_url = user_input.get(CONF_BASE_URL, "")
+
+                if (
+                    new_lat != old_lat
+                    or new_lon != old_lon
+                    or base_url != self.config_entry.options.get(CONF_BASE_URL, "")
+                ):
+                    await validate_coordinates(
+                        self.hass,
+                        new_lat,
+                        new_lon,
+                        base_url,
+                        self.config_entry.options.get(
+                            CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS
+                        ),
+                        self.config_entry.options.get(CONF_METRICS),
+                    )
 
                 # Update the config entry with new data and title if name changed
                 location_name = user_input.get(CONF_NAME, DEFAULT_NAME)
 
+                options = {
+                    **self.config_entry.options,
+                    CONF_HIGH_RESOLUTION: user_input[CONF_HIGH_RESOLUTION],
+                    CONF_LONG_TERM_STATISTICS: user_input[CONF_LONG_TERM_STATISTICS],
+                    CONF_FORECAST_ATTRIBUTES: user_input[CONF_FORECAST_ATTRIBUTES],
+                    CONF_LOW_FOOTPRINT: user_input[CONF_LOW_FOOTPRINT],
+                    CONF_EXTRA_SOURCES: user_input[CONF_EXTRA_SOURCES],
+                    CONF_BASE_URL: base_url,
+                }
+
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
                     title=location_name,
@@ -158,12 +425,11 @@ class OpenMeteoOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_LATITUDE: new_lat,
                         CONF_LONGITUDE: new_lon,
                     },
+                    options=options,
                 )
 
-                # Trigger a coordinator refresh
-                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-
-                return self.async_create_entry(title="", data={})
+                # The update listener reloads the entry if the location changed
+                return self.async_create_entry(title="", data=options)
 
             except CannotConnect:
                 errors["base"] = "cannot_connect"
@@ -187,11 +453,49 @@ class OpenMeteoOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_LONGITUDE,
                     default=self.config_entry.data.get(CONF_LONGITUDE),
                 ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_HIGH_RESOLUTION,
+                    default=self.config_entry.options.get(
+                        CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_LONG_TERM_STATISTICS,
+                    default=self.config_entry.options.get(
+                        CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_FORECAST_ATTRIBUTES,
+                    default=self.config_entry.options.get(
+                        CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_LOW_FOOTPRINT,
+                    default=self.config_entry.options.get(
+                        CONF_LOW_FOOTPRINT, DEFAULT_LOW_FOOTPRINT
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_EXTRA_SOURCES,
+                    default=self.config_entry.options.get(CONF_EXTRA_SOURCES, []),
+                ): cv.multi_select(
+                    {key: source.name for key, source in SOURCES.items()}
+                ),
+                vol.Optional(
+                    CONF_BASE_URL,
+                    description={
+                        "suggested_value": self.config_entry.options.get(
+                            CONF_BASE_URL
+                        )
+                    },
+                ): cv.url,
             }
         )
 
         return self.async_show_form(
-            step_id="init",
+            step_id="location",
             data_schema=data_schema,
             errors=errors,
         )
@@ -1,12 +1,32 @@
 """Constants for the Open-Meteo CloudCover integration."""
 
 DOMAIN = "open_meteo_cloudcover"
+DATA_CLIENT = f"{DOMAIN}_client"
 
 # Configuration
 CONF_LATITUDE = "latitude"
 CONF_LONGITUDE = "longitude"
 CONF_FORECAST_DAYS = "forecast_days"
 CONF_NAME = "name"
+CONF_HIGH_RESOLUTION = "high_resolution"
+CONF_LOCATIONS = "locations"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_FORECAST_ATTRIBUTES = "forecast_attributes"
+CONF_LOW_FOOTPRINT = "low_footprint"
+CONF_ALERT_RULES = "alert_rules"
+CONF_METRIC = "metric"
+CONF_COMPARISON = "comparison"
+CONF_THRESHOLD = "threshold"
+CONF_WINDOW_HOURS = "window_hours"
+CONF_REMOVE_ALERTS = "remove_alerts"
+CONF_DAILY_LIMIT = "daily_limit"
+CONF_MINUTE_LIMIT = "minute_limit"
+CONF_EXTRA_SOURCES = "extra_sources"
+CONF_BASE_URL = "base_url"
+CONF_RESPONSE_CACHE = "response_cache"
+CONF_METRICS = "metrics"
+CONF_HOURLY_SENSORS = "hourly_sensors"
+CONF_REFRESH_HOURS = "refresh_hours"
 
 # Defaults
 DEFAULT_NAME = "Home"
@@ -14,9 +34,48 @@ DEFAULT_SCAN_INTERVAL = 3600  # 1 hour in seconds
 DEFAULT_FORECAST_DAYS = 7  # Current day + next 6 days
 MIN_FORECAST_DAYS = 1
 MAX_FORECAST_DAYS = 7
+DEFAULT_HIGH_RESOLUTION = False
+DEFAULT_LONG_TERM_STATISTICS = False
+DEFAULT_FORECAST_ATTRIBUTES = True
+DEFAULT_LOW_FOOTPRINT = False
+DEFAULT_RESPONSE_CACHE = False
+DEFAULT_HOURLY_SENSORS = 24
+MAX_HOURLY_SENSORS = 24
+DEFAULT_REFRESH_HOURS = 1
+MAX_REFRESH_HOURS = 24
+DEFAULT_MINUTELY_SCAN_INTERVAL = 900  # 15 minutes in seconds
+MINUTELY_15_STEPS = 24  # 6 hours of 15-minute steps
+SEED_MAX_AGE = 600  # Seconds a validation response may seed the first refresh
+PROCESSING_EXECUTOR_VALUES = 480  # Hourly values (hours x columns) above which processing leaves the event loop
+SOURCE_CHECK_INTERVAL = 300  # Seconds between checks for due extra sources
+MIN_REFRESH_SPACING = 60  # Seconds within which repeated refreshes reuse the last fetch
 
 # API
 API_URL = "https://api.open-meteo.com/v1/forecast"
+AIR_QUALITY_API_URL = "https://air-quality-api.open-meteo.com/v1/air-quality"
+SATELLITE_API_URL = "https://satellite-api.open-meteo.com/v1/archive"
+DEFAULT_DAILY_LIMIT = 10000  # Free tier calls per day
+DEFAULT_MINUTE_LIMIT = 600  # Free tier calls per minute
+BUDGET_RESERVE = 0.1  # Share of each quota kept for urgent requests
+BUDGET_RETRY_INTERVAL = 300  # Seconds before retrying a deferred refresh
+
+# Extra sources
+SOURCE_AIR_QUALITY = "air_quality"
+SOURCE_SATELLITE_RADIATION = "satellite_radiation"
+
+# Alerts
+COMPARISON_BELOW = "below"
+COMPARISON_ABOVE = "above"
+DEFAULT_WINDOW_HOURS = 6
+MAX_WINDOW_HOURS = 168
+EVENT_ALERT = f"{DOMAIN}_alert"
+
+# Dispatcher signal (suffixed with the entry id) sent when options are applied live
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated"
+
+# Services
+SERVICE_GET_MINUTELY_15_FORECAST = "get_minutely_15_forecast"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 
 # Day names for forecast sensors
 def get_day_name(day_offset: int) -> str:
@@ -94,3 +153,54 @@ SENSOR_TYPES = {
         "state_class": "measurement",
     },
 }
+
+# Metrics fetched in high resolution (15-minute) mode
+MINUTELY_15_SENSOR_TYPES = [
+    "cloud_cover",
+    "direct_radiation",
+]
+
+# Metrics with daylight-only daily aggregates (night hours excluded)
+DAYLIGHT_SENSOR_TYPES = [
+    "cloud_cover",
+    "cloud_cover_low",
+    "cloud_cover_mid",
+    "cloud_cover_high",
+    "direct_radiation",
+]
+
+# Sensor types served by extra sources, keyed by series column
+SOURCE_SENSOR_TYPES = {
+    "aerosol_optical_depth": {
+        "name": "Aerosol Optical Depth",
+        "unit": None,
+        "icon": "mdi:weather-hazy",
+        "device_class": None,
+        "state_class": "measurement",
+        "source": SOURCE_AIR_QUALITY,
+    },
+    "dust": {
+        "name": "Dust",
+        "unit": "μg/m³",
+        "icon": "mdi:weather-dust",
+        "device_class": None,
+        "state_class": "measurement",
+        "source": SOURCE_AIR_QUALITY,
+    },
+    "satellite_shortwave_radiation": {
+        "name": "Satellite Shortwave Radiation",
+        "unit": "W/m²",
+        "icon": "mdi:satellite-variant",
+        "device_class": "irradiance",
+        "state_class": "measurement",
+        "source": SOURCE_SATELLITE_RADIATION,
+    },
+    "satellite_direct_radiation": {
+        "name": "Satellite Direct Radiation",
+        "unit": "W/m²",
+        "icon": "mdi:satellite-variant",
+        "device_class": "irradiance",
+        "state_class": "measurement",
+        "source": SOURCE_SATELLITE_RADIATION,
+    },
+}
@@ -1,27 +1,66 @@
 """DataUpdateCoordinator for Open-Meteo CloudCover integration."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
+import hashlib
+from http import HTTPStatus
+import json
 import logging
+import math
+import time
 from typing import Any
 
 import aiohttp
-import async_timeout
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    async_track_time_change,
+    async_track_time_interval,
+)
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.util import dt as dt_util
 
+from .api import (
+    BudgetExhausted,
+    async_get_client,
+    build_forecast_params,
+    resolve_url,
+)
 from .const import (
     API_URL,
+    BUDGET_RETRY_INTERVAL,
     CONF_LATITUDE,
     CONF_LONGITUDE,
+    CONF_NAME,
+    CONF_WINDOW_HOURS,
+    DAYLIGHT_SENSOR_TYPES,
+    DEFAULT_FORECAST_DAYS,
+    DEFAULT_MINUTELY_SCAN_INTERVAL,
+    DEFAULT_NAME,
+    DEFAULT_REFRESH_HOURS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    EVENT_ALERT,
+    MIN_REFRESH_SPACING,
+    MINUTELY_15_SENSOR_TYPES,
+    MINUTELY_15_STEPS,
+    PROCESSING_EXECUTOR_VALUES,
+    SENSOR_TYPES,
+    SOURCE_CHECK_INTERVAL,
+)
+from .forecast import (
+    ForecastSeries,
+    evaluate_alerts,
+    process_forecast,
+    reaggregate_series,
 )
+from .sources import SOURCES, ForecastSource
+from .statistics import async_import_forecast_statistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,12 +73,65 @@ class OpenMeteoDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         latitude: float,
         longitude: float,
-        forecast_days: int = 7,
+        forecast_days: int = DEFAULT_FORECAST_DAYS,
+        location_name: str = DEFAULT_NAME,
+        entry_id: str | None = None,
+        long_term_statistics: bool = False,
+        low_footprint: bool = False,
+        alert_rules: list[dict[str, Any]] | None = None,
+        sources: list[str] | None = None,
+        base_url: str | None = None,
+        metrics: list[str] | None = None,
+        refresh_hours: int = DEFAULT_REFRESH_HOURS,
     ) -> None:
         """Initialize the coordinator."""
         self.latitude = latitude
         self.longitude = longitude
         self.forecast_days = forecast_days
+        # Metrics fetched and aggregated, in SENSOR_TYPES order
+        self.metrics = [
+            metric for metric in SENSOR_TYPES if metric in (metrics or SENSOR_TYPES)
+        ]
+        self.refresh_hours = refresh_hours
+        self.location_name = location_name
+        self.entry_id = entry_id
+        # Write each issued forecast to long-term statistics when enabled
+        self.long_term_statistics = long_term_statistics
+        # Keep only compact data for the horizon enabled entities need
+        self.low_footprint = low_footprint
+        # Threshold rules evaluated once per refresh
+        self.alert_rules = alert_rules or []
+        self._client = async_get_client(hass)
+        # Entry-specific endpoint, falling back to the domain-wide one
+        self.base_url = base_url or self._client.base_url
+        self.api_url = resolve_url(API_URL, self.base_url)
+        # High resolution companion coordinator, set up when enabled
+        self.minutely: OpenMeteoMinutelyCoordinator | None = None
+
+        # Extra APIs merged into the series, each fetched on its own cadence
+        self.sources: list[ForecastSource] = [
+            SOURCES[key] for key in sources or [] if key in SOURCES
+        ]
+        self._source_series: dict[str, ForecastSeries] = {}
+        self._source_fetched: dict[str, float] = {}
+        # Sources the configured base URL does not serve, fetched publicly
+        self._source_public: set[str] = set()
+
+        # Processing timings from the last refresh, reported in diagnostics
+        self.processing_time: float | None = None
+        self.loop_blocking_time: float | None = None
+        self.processed_in_executor = False
+        # Time spent decoding extra source responses on the event loop
+        self._source_parse_time = 0.0
+        # Last forecast request and a fingerprint of its response body
+        self.last_request_params: dict[str, Any] | None = None
+        self.last_response_fingerprint: dict[str, Any] | None = None
+        # Time of the last successful fetch, for refresh spacing
+        self._last_fetch: datetime | None = None
+        # Hour offsets aggregated by the last fetch, reused between fetches
+        self._hour_offsets: list[int] | None = None
+        # Set by requested (e.g. manual) refreshes, which may use the reserve
+        self._refresh_requested = False
 
         # Start with default interval, will be adjusted after first update
         super().__init__(
@@ -50,293 +142,546 @@ class OpenMeteoDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
     def _calculate_next_update_interval(self) -> timedelta:
-        """Calculate interval to next hour boundary plus a few seconds."""
+        """Calculate interval to next refresh hour boundary plus a few seconds."""
         now = dt_util.now()
         # Get next hour boundary
-        next_hour = (now + timedelta(hours=1)).replace(minute=0, second=5, microsecond=0)
+        next_hour = (now + timedelta(hours=self.refresh_hours)).replace(
+            minute=0, second=5, microsecond=0
+        )
         # Calculate time until next hour (plus 5 seconds to ensure we're past the hour)
         interval = next_hour - now
         return interval
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Open-Meteo API."""
-        # Use Home Assistant's configured timezone
-        timezone = str(self.hass.config.time_zone)
-
-        # Calculate date range: from today to forecast_days in the future
-        now = dt_util.now()
-        start_date = now.strftime("%Y-%m-%d")
-        end_date = (now + timedelta(days=self.forecast_days)).strftime("%Y-%m-%d")
+    async def async_reconfigure(
+        self,
+        forecast_days: int,
+        metrics: list[str],
+        refresh_hours: int,
+        long_term_statistics: bool,
+        low_footprint: bool,
+        alert_rules: list[dict[str, Any]],
+    ) -> None:
+        """Apply changed options without recreating the coordinator.
+
+        The current data is kept and a refresh is only requested when it
+        does not cover the new options, e.g. more days or added metrics.
+        """
+        metrics = [metric for metric in SENSOR_TYPES if metric in metrics]
+        needs_refresh = (
+            forecast_days > self.forecast_days
+            or not set(metrics) <= set(self.metrics)
+            or low_footprint != self.low_footprint
+            # Low footprint data may not reach the end of a longer alert window
+            or (
+                low_footprint
+                and _alert_days(alert_rules) > _alert_days(self.alert_rules)
+            )
+        )
 
-        params = {
-            "latitude": self.latitude,
-            "longitude": self.longitude,
-            "start_date": start_date,
-            "end_date": end_date,
-            "timezone": timezone,  # Request data in HA timezone
-            "hourly": ",".join([
-                "evapotranspiration",
-                "soil_temperature_0cm",
-                "soil_moisture_0_to_1cm",
-                "et0_fao_evapotranspiration",
-                "cloud_cover",
-                "cloud_cover_low",
-                "cloud_cover_mid",
-                "cloud_cover_high",
-                "direct_radiation",
-            ]),
+        self.forecast_days = forecast_days
+        self.metrics = metrics
+        self.refresh_hours = refresh_hours
+        self.long_term_statistics = long_term_statistics
+        self.low_footprint = low_footprint
+        self.alert_rules = alert_rules
+        if self.minutely is not None:
+            self.minutely.low_footprint = low_footprint
+
+        if needs_refresh or not self.data:
+            # The current data no longer suffices, so bypass refresh spacing
+            self._last_fetch = None
+            await self.async_request_refresh()
+            return
+
+        # Re-evaluate alert rules against the cached series
+        self.data = {
+            **self.data,
+            "_alerts": self._evaluate_alerts(self.data["_series"], dt_util.now()),
         }
-
+        self.update_interval = self._calculate_next_update_interval()
+        self._schedule_refresh()
+        self.async_update_listeners()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that may use the reserved API budget."""
+        self._refresh_requested = True
+        await super().async_request_refresh()
+
+    def _enabled_horizon(self) -> tuple[int, list[int] | None]:
+        """Return the forecast days and hour offsets enabled entities need.
+
+        Falls back to the full horizon when no entities are registered yet,
+        e.g. on the first refresh of a new entry.
+        """
+        registry = er.async_get(self.hass)
+        entries = er.async_entries_for_config_entry(registry, self.entry_id)
+        if not entries:
+            return self.forecast_days, None
+
+        max_day = 0
+        hour_offsets: set[int] = set()
+        for entity_entry in entries:
+            if entity_entry.disabled:
+                continue
+            # The weather entity serves forecasts for the full horizon
+            if entity_entry.unique_id == f"{self.entry_id}_weather":
+                max_day = self.forecast_days
+                continue
+            suffix = entity_entry.unique_id.rsplit("_", 2)
+            if suffix[-2] == "hour" and suffix[-1].isdigit():
+                hour_offsets.add(int(suffix[-1]))
+            elif suffix[-1].isdigit():
+                max_day = max(max_day, int(suffix[-1]))
+
+        # Alert windows start now and may reach into later days
+        max_day = max(max_day, _alert_days(self.alert_rules))
+
+        # Hour sensors and next hour may reach into tomorrow
+        return min(max(max_day, 1), self.forecast_days), sorted(hour_offsets)
+
+    def _evaluate_alerts(
+        self, series: ForecastSeries, now: datetime
+    ) -> dict[str, dict[str, Any]]:
+        """Evaluate the alert rules and fire events for newly triggered ones."""
+        alerts = evaluate_alerts(series, self.alert_rules, now.timestamp())
+
+        # The first evaluation after setup (restart or reload) cannot tell
+        # new crossings from ones already notified, so it fires no events
+        if self.data is None:
+            return alerts
+        previous = self.data.get("_alerts", {})
+
+        for rule in self.alert_rules:
+            alert = alerts[rule["id"]]
+            was_triggered = previous.get(rule["id"], {}).get("first_crossing")
+            if alert["first_crossing"] is None or was_triggered is not None:
+                continue
+            self.hass.bus.async_fire(
+                EVENT_ALERT,
+                {
+                    "entry_id": self.entry_id,
+                    "rule_id": rule["id"],
+                    "name": rule[CONF_NAME],
+                    "metric": rule["metric"],
+                    "comparison": rule["comparison"],
+                    "threshold": rule["threshold"],
+                    "first_crossing": dt_util.utc_from_timestamp(
+                        alert["first_crossing"]
+                    ).isoformat(),
+                    "value": alert["value"],
+                },
+            )
+
+        return alerts
+
+    async def _async_fetch_source(self, source: ForecastSource, now: datetime) -> None:
+        """Fetch one extra source and keep its series for merging."""
+        params = source.build_params(
+            self.latitude, self.longitude, now, str(self.hass.config.time_zone)
+        )
+        url = resolve_url(source.url, self.base_url)
+        if source.key in self._source_public:
+            url = source.url
         try:
-            async with async_timeout.timeout(30):
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(API_URL, params=params) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                        # Transform the data to make it easier to work with
-                        # Group hourly forecast data by day
-                        hourly = data.get("hourly", {})
-                        times = hourly.get("time", [])
+            raw = await self._client.async_fetch(url, params, urgent=False)
+        except aiohttp.ClientResponseError as err:
+            # Mirrors often serve only the forecast API; use the public one
+            if url == source.url or err.status != HTTPStatus.NOT_FOUND:
+                raise
+            _LOGGER.info(
+                "%s is not served by %s, using the public API",
+                source.key,
+                self.base_url,
+            )
+            self._source_public.add(source.key)
+            raw = await self._client.async_fetch(source.url, params, urgent=False)
+        start = time.perf_counter()
+        self._source_series[source.key] = source.parse(json.loads(raw))
+        self._source_parse_time += time.perf_counter() - start
+        self._source_fetched[source.key] = time.monotonic()
+
+    async def _async_refresh_sources(self, now: datetime) -> bool:
+        """Fetch the extra sources that are due, concurrently.
+
+        Failures only leave a source's previous data in place; they never
+        fail the forecast refresh. Returns True if any source was updated.
+        """
+        monotonic = time.monotonic()
+        due = [
+            source
+            for source in self.sources
+            if monotonic - self._source_fetched.get(source.key, -math.inf)
+            >= source.update_interval.total_seconds()
+        ]
+        if not due:
+            return False
+
+        results = await asyncio.gather(
+            *(self._async_fetch_source(source, now) for source in due),
+            return_exceptions=True,
+        )
+        updated = False
+        for source, result in zip(due, results):
+            if isinstance(result, BudgetExhausted):
+                _LOGGER.debug("Deferring %s refresh: %s", source.key, result)
+            elif isinstance(result, Exception):
+                _LOGGER.warning("Error fetching %s data: %s", source.key, result)
+                # Retry on the source's own cadence, not every check
+                self._source_fetched[source.key] = monotonic
+            else:
+                updated = True
+        return updated
+
+    def _merge_sources(self, sensor_data: dict[str, Any], now: datetime) -> None:
+        """Merge the extra source series into the forecast series."""
+        series = sensor_data["_series"]
+        for source in self.sources:
+            if (source_series := self._source_series.get(source.key)) is None:
+                continue
+            series = series.merge(source_series)
+            for column in source.columns:
+                # Observation sources lag behind, so report the newest value
+                value = source_series.latest(column, now.timestamp())
+                if value is not None:
+                    sensor_data[f"{column}_latest"] = {"value": value, "type": "latest"}
+        sensor_data["_series"] = series
+
+    async def _async_source_tick(self, now: datetime) -> None:
+        """Refresh due extra sources between forecast refreshes."""
+        if not self.data or not await self._async_refresh_sources(dt_util.now()):
+            return
+        # Update in place so the hour-aligned refresh schedule is kept
+        self.data = {**self.data}
+        self._merge_sources(self.data, dt_util.now())
+        self.async_update_listeners()
+
+    @callback
+    def async_start_sources(self) -> CALLBACK_TYPE | None:
+        """Start refreshing the extra sources on their own schedules."""
+        if not self.sources:
+            return None
+        return async_track_time_interval(
+            self.hass, self._async_source_tick, timedelta(seconds=SOURCE_CHECK_INTERVAL)
+        )
 
-                        if not times:
-                            raise UpdateFailed("No data received from Open-Meteo API")
+    @callback
+    def _finish_sensor_data(self, sensor_data: dict[str, Any], now: datetime) -> None:
+        """Merge the extra sources and evaluate the alert rules."""
+        self._merge_sources(sensor_data, now)
+        sensor_data["_alerts"] = self._evaluate_alerts(sensor_data["_series"], now)
 
-                        # Build sensor data grouped by day and metric
-                        sensor_data = self._group_by_day(times, hourly)
+    async def _async_hour_tick(self, now: datetime) -> None:
+        """Move hour-relative values forward between fetches.
 
-                        # Add metadata
-                        sensor_data["_metadata"] = {
-                            "latitude": data.get("latitude"),
-                            "longitude": data.get("longitude"),
-                            "timezone": data.get("timezone"),
-                            "elevation": data.get("elevation"),
-                        }
+        With a refresh interval above one hour, this hour, next hour, hour N,
+        today's current value and the alerts are re-derived from the cached
+        series every hour without a request.
+        """
+        now = dt_util.now()
+        if not self.data or _fetched_this_hour(self._last_fetch, now):
+            return
+
+        series = self.data["_series"]
+        sensor_data = await self.hass.async_add_executor_job(
+            reaggregate_series,
+            series,
+            [metric for metric in self.metrics if metric in series.columns],
+            now,
+            DAYLIGHT_SENSOR_TYPES,
+            self._hour_offsets,
+            self.low_footprint,
+        )
+        sensor_data["_metadata"] = self.data.get("_metadata", {})
+        self._finish_sensor_data(sensor_data, now)
+
+        # Update in place so the refresh schedule is kept
+        self.data = sensor_data
+        self.async_update_listeners()
+
+    @callback
+    def async_start_hour_tick(self) -> CALLBACK_TYPE:
+        """Start re-deriving hour-relative values at each hour boundary."""
+        # Runs after the hour-aligned refresh, which it skips if that fetched
+        return async_track_time_change(
+            self.hass, self._async_hour_tick, minute=0, second=30
+        )
 
-                        return sensor_data
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from Open-Meteo API."""
+        now = dt_util.now()
+        metrics = self.metrics
+        # Setup and requested refreshes are urgent, scheduled ones are not
+        urgent = self.data is None or self._refresh_requested
+        self._refresh_requested = False
+
+        # Manual refreshes right after a fetch reuse its data
+        if self.data is not None and _recently_fetched(self._last_fetch, now, 60):
+            _LOGGER.debug("Skipping %s refresh, last fetch is recent", self.name)
+            self.update_interval = self._calculate_next_update_interval()
+            return self.data
+
+        forecast_days, hour_offsets = self.forecast_days, None
+        if self.low_footprint and not self.long_term_statistics and self.entry_id:
+            forecast_days, hour_offsets = self._enabled_horizon()
+
+        params = build_forecast_params(
+            self.latitude,
+            self.longitude,
+            forecast_days,
+            now,
+            str(self.hass.config.time_zone),  # Use Home Assistant's configured timezone
+            metrics,
+        )
 
+        self._source_parse_time = 0.0
+        try:
+            # Reuse the config flow's validation response when it is still fresh
+            raw = self._client.async_pop_seed(self.api_url, params)
+            if raw is None:
+                # Scheduled refreshes yield to urgent requests when budget is low
+                raw, _ = await asyncio.gather(
+                    self._client.async_fetch(self.api_url, params, urgent=urgent),
+                    self._async_refresh_sources(now),
+                )
+            else:
+                await self._async_refresh_sources(now)
+
+            self.last_request_params = params
+            self.last_response_fingerprint = _fingerprint(raw)
+
+            # Decode and aggregate off the event loop unless the response is
+            # small; the request spans forecast_days + 1 dates, plus is_day
+            self.processed_in_executor = (
+                _hourly_value_count(forecast_days, metrics) > PROCESSING_EXECUTOR_VALUES
+            )
+            if self.processed_in_executor:
+                sensor_data, self.processing_time = await self.hass.async_add_executor_job(
+                    _timed_process_forecast,
+                    raw,
+                    metrics,
+                    now,
+                    hour_offsets,
+                    self.low_footprint,
+                )
+                loop_time = 0.0
+            else:
+                sensor_data, self.processing_time = _timed_process_forecast(
+                    raw, metrics, now, hour_offsets, self.low_footprint
+                )
+                loop_time = self.processing_time
+
+        except BudgetExhausted as err:
+            return _defer_refresh(self, err)
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error communicating with Open-Meteo API: {err}") from err
         except Exception as err:
             raise UpdateFailed(f"Unexpected error fetching data: {err}") from err
 
-    def _group_by_day(self, times: list[str], hourly: dict[str, list]) -> dict[str, Any]:
-        """Group hourly forecast data by day for each metric."""
-        from collections import defaultdict
-        from datetime import timezone
+        # Everything below runs on the event loop, like the source decoding
+        start = time.perf_counter()
+        self._finish_sensor_data(sensor_data, now)
+
+        if self.long_term_statistics and self.entry_id:
+            async_import_forecast_statistics(
+                self.hass,
+                self.entry_id,
+                self.location_name,
+                sensor_data["_series"],
+            )
+        self.loop_blocking_time = (
+            loop_time + self._source_parse_time + time.perf_counter() - start
+        )
 
-        # Get current time for finding closest hour (timezone-aware)
-        now = dt_util.now()
+        # Adjust next update to align with hour boundary
+        self.update_interval = self._calculate_next_update_interval()
+        self._last_fetch = now
+        self._hour_offsets = hour_offsets
 
-        # Group times and values by date
-        daily_data = defaultdict(lambda: defaultdict(list))
+        return sensor_data
 
-        for idx, time_str in enumerate(times):
-            # Parse the timestamp - Open-Meteo returns ISO format strings
-            # in the timezone we requested (HA's timezone)
-            try:
-                # Try parsing with fromisoformat first
-                dt = datetime.fromisoformat(time_str)
 
-                # If it's naive (no timezone), the API returned it in our requested timezone
-                # So we need to attach HA's timezone to it (not convert, just attach)
-                if dt.tzinfo is None:
-                    # The timestamp is already in HA's timezone, just make it aware
-                    dt = dt_util.as_local(dt)
+def _defer_refresh(
+    coordinator: DataUpdateCoordinator, err: BudgetExhausted
+) -> dict[str, Any]:
+    """Keep the current data and retry soon when the API budget is low."""
+    if coordinator.data is None:
+        raise UpdateFailed(str(err)) from err
+    _LOGGER.debug("Deferring %s refresh: %s", coordinator.name, err)
+    coordinator.update_interval = timedelta(seconds=BUDGET_RETRY_INTERVAL)
+    return coordinator.data
 
-            except Exception as err:
-                _LOGGER.warning("Failed to parse timestamp %s: %s", time_str, err)
-                continue
 
-            date_key = dt.date()
-
-            # Store each metric's value for this hour
-            for metric in [
-                "evapotranspiration",
-                "soil_temperature_0cm",
-                "soil_moisture_0_to_1cm",
-                "et0_fao_evapotranspiration",
-                "cloud_cover",
-                "cloud_cover_low",
-                "cloud_cover_mid",
-                "cloud_cover_high",
-                "direct_radiation",
-            ]:
-                values = hourly.get(metric, [])
-                if idx < len(values) and values[idx] is not None:
-                    daily_data[date_key][metric].append({
-                        "time": time_str,
-                        "value": values[idx],
-                        "datetime": dt,
-                    })
-
-        # Calculate daily aggregates and assign day offsets
-        sensor_data = {}
-
-        # Use current date (today) as the reference for day offset calculation
-        today = now.date()
-
-        # First pass: extract this_hour and next_hour for each metric from all available data
-        # We need to look across all days since "now" might be late in the day
-        for metric in [
-            "evapotranspiration",
-            "soil_temperature_0cm",
-            "soil_moisture_0_to_1cm",
-            "et0_fao_evapotranspiration",
-            "cloud_cover",
-            "cloud_cover_low",
-            "cloud_cover_mid",
-            "cloud_cover_high",
-            "direct_radiation",
-        ]:
-            # Collect all hourly values for this metric across all days
-            all_hourly_values = []
-            for date_key in sorted(daily_data.keys()):
-                if metric in daily_data[date_key]:
-                    all_hourly_values.extend(daily_data[date_key][metric])
-
-            if not all_hourly_values:
-                continue
+def _recently_fetched(
+    last_fetch: datetime | None, now: datetime, slot_minutes: int
+) -> bool:
+    """Return True if the last fetch is recent and in the current time slot.
 
-            # Find this hour and next hour values
-            # This hour = the hour block we're currently in (e.g., at 11:30, use 11:00)
-            # Next hour = the next hour block (e.g., at 11:30, use 12:00)
-            this_hour_value = None
-            next_hour_value = None
-
-            # Get the current hour and next hour boundaries
-            current_hour = now.replace(minute=0, second=0, microsecond=0)
-            from datetime import timedelta
-            next_hour_boundary = current_hour + timedelta(hours=1)
-
-            for h in all_hourly_values:
-                h_hour = h["datetime"].replace(minute=0, second=0, microsecond=0)
-
-                # This hour: matches current hour boundary
-                if h_hour == current_hour:
-                    this_hour_value = h["value"]
-
-                # Next hour: matches next hour boundary
-                if h_hour == next_hour_boundary:
-                    next_hour_value = h["value"]
-
-                # Stop if we've found both
-                if this_hour_value is not None and next_hour_value is not None:
-                    break
-
-            # If no match found, use the last available hour
-            if this_hour_value is None and all_hourly_values:
-                this_hour_value = all_hourly_values[-1]["value"]
-
-            # Store this_hour and next_hour as special sensor keys
-            if this_hour_value is not None:
-                sensor_data[f"{metric}_this_hour"] = {
-                    "value": this_hour_value,
-                    "type": "this_hour",
-                }
+    A fetch just before a slot boundary never suppresses the refresh that
+    moves the current hour or 15-minute step forward.
+    """
+    if last_fetch is None:
+        return False
+    return (
+        (now - last_fetch).total_seconds() < MIN_REFRESH_SPACING
+        and now.hour == last_fetch.hour
+        and now.minute // slot_minutes == last_fetch.minute // slot_minutes
+    )
 
-            if next_hour_value is not None:
-                sensor_data[f"{metric}_next_hour"] = {
-                    "value": next_hour_value,
-                    "type": "next_hour",
-                }
 
-        # Second pass: process daily data
-        for date_key in sorted(daily_data.keys()):
-            # Calculate day offset from today (0=today, 1=tomorrow, etc.)
-            day_offset = (date_key - today).days
-
-            for metric, hourly_values in daily_data[date_key].items():
-                if not hourly_values:
-                    continue
-
-                # Extract just the numeric values for calculations
-                values = [h["value"] for h in hourly_values]
-
-                # Find the current hour's value (closest to now without going into the past)
-                current_value = None
-                if day_offset == 0:  # Only for today
-                    # Find the value for current or next hour
-                    for h in hourly_values:
-                        if h["datetime"] >= now:
-                            current_value = h["value"]
-                            break
-                    # If no future hour found, use the last hour of today
-                    if current_value is None and hourly_values:
-                        current_value = hourly_values[-1]["value"]
-                else:
-                    # For future days, use first hour of the day
-                    current_value = hourly_values[0]["value"] if hourly_values else None
-
-                # Build the sensor data key: metric_dayoffset
-                sensor_key = f"{metric}_{day_offset}"
-
-                # Build hourly forecast as dict with timestamp keys
-                # Remove timezone info from timestamp keys for cleaner display
-                hourly_data = {}
-                for h in hourly_values:
-                    # Get just the datetime part without timezone offset
-                    time_str = h["datetime"].strftime("%Y-%m-%dT%H:%M")
-                    hourly_data[time_str] = h["value"]
-
-                sensor_data[sensor_key] = {
-                    "date": str(date_key),
-                    "day_offset": day_offset,
-                    "current": current_value,
-                    "hourly_data": hourly_data,
-                    "min": round(min(values), 2) if values else None,
-                    "max": round(max(values), 2) if values else None,
-                    "avg": round(sum(values) / len(values), 2) if values else None,
-                }
+def _alert_days(alert_rules: list[dict[str, Any]]) -> int:
+    """Return the last day offset any alert window can reach from now."""
+    return max(
+        (math.ceil(rule[CONF_WINDOW_HOURS] / 24) for rule in alert_rules), default=0
+    )
 
-        # Third pass: Extract hourly sensors (hours 1-24 from current time)
-        # Collect all hourly values across all days for each metric
-        for metric in [
-            "evapotranspiration",
-            "soil_temperature_0cm",
-            "soil_moisture_0_to_1cm",
-            "et0_fao_evapotranspiration",
-            "cloud_cover",
-            "cloud_cover_low",
-            "cloud_cover_mid",
-            "cloud_cover_high",
-            "direct_radiation",
-        ]:
-            # Collect all hourly values for this metric across all days
-            all_hourly_values = []
-            for date_key in sorted(daily_data.keys()):
-                if metric in daily_data[date_key]:
-                    all_hourly_values.extend(daily_data[date_key][metric])
-
-            if not all_hourly_values:
-                continue
 
-            # Sort by datetime to ensure proper ordering
-            all_hourly_values.sort(key=lambda h: h["datetime"])
-
-            # Find hours 1-24 from current time
-            for hour_offset in range(1, 25):
-                target_hour = now + timedelta(hours=hour_offset)
-                target_hour_boundary = target_hour.replace(minute=0, second=0, microsecond=0)
-
-                # Find the value for this hour
-                hour_value = None
-                for h in all_hourly_values:
-                    h_hour = h["datetime"].replace(minute=0, second=0, microsecond=0)
-                    if h_hour == target_hour_boundary:
-                        hour_value = h["value"]
-                        break
-
-                # Store the hourly sensor data if found
-                if hour_value is not None:
-                    sensor_key = f"{metric}_hour_{hour_offset}"
-                    sensor_data[sensor_key] = {
-                        "value": hour_value,
-                        "hour_offset": hour_offset,
-                        "type": "hourly",
-                    }
+def _fetched_this_hour(last_fetch: datetime | None, now: datetime) -> bool:
+    """Return True if the last fetch was made in the current hour."""
+    return (
+        last_fetch is not None
+        and (now - last_fetch) < timedelta(hours=1)
+        and now.hour == last_fetch.hour
+    )
 
-        # Adjust next update to align with hour boundary
+
+def _hourly_value_count(forecast_days: int, metrics: list[str]) -> int:
+    """Return the number of hourly values a forecast request returns."""
+    return (forecast_days + 1) * 24 * (len(metrics or SENSOR_TYPES) + 1)
+
+
+def _fingerprint(raw: bytes) -> dict[str, Any]:
+    """Return a short fingerprint identifying a response body."""
+    return {"sha256": hashlib.sha256(raw).hexdigest()[:16], "bytes": len(raw)}
+
+
+def _timed_process_forecast(
+    raw: bytes,
+    metrics: list[str],
+    now: datetime,
+    hour_offsets: list[int] | None,
+    low_footprint: bool,
+) -> tuple[dict[str, Any], float]:
+    """Process a forecast response and return it with the time taken."""
+    start = time.perf_counter()
+    sensor_data = process_forecast(
+        raw, metrics, now, DAYLIGHT_SENSOR_TYPES, hour_offsets, low_footprint
+    )
+    return sensor_data, time.perf_counter() - start
+
+
+class OpenMeteoMinutelyCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Open-Meteo 15-minute data for a short horizon."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        latitude: float,
+        longitude: float,
+        low_footprint: bool = False,
+        base_url: str | None = None,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.latitude = latitude
+        self.longitude = longitude
+        self.low_footprint = low_footprint
+        self._client = async_get_client(hass)
+        self.api_url = resolve_url(API_URL, base_url or self._client.base_url)
+        self._last_fetch: datetime | None = None
+        self._refresh_requested = False
+        # Time the last refresh spent decoding and indexing on the event loop
+        self.loop_blocking_time: float | None = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_minutely_15",
+            update_interval=timedelta(seconds=DEFAULT_MINUTELY_SCAN_INTERVAL),
+        )
+
+    def _calculate_next_update_interval(self) -> timedelta:
+        """Calculate interval to next 15-minute boundary plus a few seconds."""
+        now = dt_util.now()
+        # Get next 15-minute boundary
+        step_start = now.replace(minute=now.minute - now.minute % 15, second=0, microsecond=0)
+        next_step = step_start + timedelta(seconds=DEFAULT_MINUTELY_SCAN_INTERVAL + 5)
+        return next_step - now
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that may use the reserved API budget."""
+        self._refresh_requested = True
+        await super().async_request_refresh()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch 15-minute data from Open-Meteo API."""
+        now = dt_util.now()
+        urgent = self.data is None or self._refresh_requested
+        self._refresh_requested = False
+
+        # Manual refreshes right after a fetch reuse its data
+        if self.data is not None and _recently_fetched(self._last_fetch, now, 15):
+            _LOGGER.debug("Skipping %s refresh, last fetch is recent", self.name)
+            self.update_interval = self._calculate_next_update_interval()
+            return self.data
+
+        params = {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "minutely_15": ",".join(MINUTELY_15_SENSOR_TYPES),
+            "forecast_minutely_15": MINUTELY_15_STEPS,
+            "timeformat": "unixtime",
+        }
+
+        try:
+            raw = await self._client.async_fetch(self.api_url, params, urgent=urgent)
+            start = time.perf_counter()
+            data = json.loads(raw)
+        except BudgetExhausted as err:
+            return _defer_refresh(self, err)
+        except aiohttp.ClientError as err:
+            raise UpdateFailed(f"Error communicating with Open-Meteo API: {err}") from err
+        except Exception as err:
+            raise UpdateFailed(f"Unexpected error fetching data: {err}") from err
+
+        series = ForecastSeries.from_block(
+            data.get("minutely_15", {}),
+            MINUTELY_15_SENSOR_TYPES,
+            interval=DEFAULT_MINUTELY_SCAN_INTERVAL,
+        )
+        if not series:
+            raise UpdateFailed("No 15-minute data received from Open-Meteo API")
+        if self.low_footprint:
+            series = series.compact()
+
+        # Resolve the current and next 15-minute steps once per refresh
+        now_ts = dt_util.utcnow().timestamp()
+        next_ts = now_ts + series.interval
+        sensor_data: dict[str, Any] = {
+            "_series": series,
+            "_metadata": {
+                "latitude": data.get("latitude"),
+                "longitude": data.get("longitude"),
+                "timezone": data.get("timezone"),
+                "elevation": data.get("elevation"),
+            },
+        }
+        for metric in MINUTELY_15_SENSOR_TYPES:
+            this_value = series.value_at(metric, now_ts)
+            next_value = series.value_at(metric, next_ts)
+            if this_value is not None:
+                sensor_data[f"{metric}_this_15min"] = {
+                    "value": this_value,
+                    "type": "this_15min",
+                }
+            if next_value is not None:
+                sensor_data[f"{metric}_next_15min"] = {
+                    "value": next_value,
+                    "type": "next_15min",
+                }
+
+        self.loop_blocking_time = time.perf_counter() - start
+
+        # Adjust next update to align with the 15-minute boundary
         self.update_interval = self._calculate_next_update_interval()
+        self._last_fetch = now
 
         return sensor_data
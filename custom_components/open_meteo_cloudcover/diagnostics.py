@@ -6,13 +6,17 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .api import async_get_client
+from .const import CONF_ALERT_RULES, CONF_BASE_URL, DOMAIN
 from .coordinator import OpenMeteoDataUpdateCoordinator
+from .forecast import ForecastSeries, is_missing
 
 TO_REDACT = {
     "latitude",
     "longitude",
+    CONF_BASE_URL,
 }
 
 
@@ -22,8 +26,12 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator: OpenMeteoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    client = async_get_client(hass)
+    budget = client.budget
+
     # Get coordinator data
     coordinator_data = coordinator.data if coordinator.data else {}
+    series: ForecastSeries | None = coordinator_data.get("_series")
 
     # Build diagnostics data with redacted location info
     diagnostics_data = {
@@ -34,6 +42,12 @@ async def async_get_config_entry_diagnostics(
                 "longitude": entry.data.get("longitude"),
                 "name": entry.data.get("name"),
             },
+            "options": {
+                key: value
+                for key, value in entry.options.items()
+                if key != CONF_ALERT_RULES
+            },
+            "alert_rules": len(entry.options.get(CONF_ALERT_RULES, [])),
         },
         "coordinator": {
             "last_update_success": coordinator.last_update_success,
@@ -44,47 +58,87 @@ async def async_get_config_entry_diagnostics(
             if coordinator.update_interval
             else None,
             "forecast_days": coordinator.forecast_days,
+            "metrics": coordinator.metrics,
+            "sources": [source.key for source in coordinator.sources],
+            "high_resolution": coordinator.minutely is not None,
+        },
+        "request": {
+            "params": coordinator.last_request_params,
+            "response": coordinator.last_response_fingerprint,
+        },
+        "api_budget": {
+            "daily_remaining": round(budget.daily.tokens, 1),
+            "daily_limit": budget.daily.capacity,
+            "minute_remaining": round(budget.minute.tokens, 1),
+            "minute_limit": budget.minute.capacity,
+            "spent": round(budget.spent, 2),
+            "deferred_requests": budget.deferred,
+            "coalesced_requests": client.coalesced,
+            "cache_hits": client.cache_hits,
+        },
+        "processing": {
+            "processing_time": coordinator.processing_time,
+            "loop_blocking_time": coordinator.loop_blocking_time,
+            "processed_in_executor": coordinator.processed_in_executor,
+            "minutely_loop_blocking_time": (
+                coordinator.minutely.loop_blocking_time
+                if coordinator.minutely is not None
+                else None
+            ),
         },
         "data_summary": {
-            "sensor_count": len([k for k in coordinator_data.keys() if k != "_metadata"]),
-            "metadata": {
-                "latitude": coordinator_data.get("_metadata", {}).get("latitude"),
-                "longitude": coordinator_data.get("_metadata", {}).get("longitude"),
-                "timezone": coordinator_data.get("_metadata", {}).get("timezone"),
-                "elevation": coordinator_data.get("_metadata", {}).get("elevation"),
-            },
+            "sensor_count": sum(
+                1 for key in coordinator_data if not key.startswith("_")
+            ),
+            "metadata": coordinator_data.get("_metadata", {}),
+            "series": _series_summary(series) if series is not None else None,
         },
-        "sensors": {},
+        "columns": _column_stats(series) if series is not None else {},
+        "sample": _sample_payload(coordinator_data, coordinator.metrics),
     }
 
-    # Add sample data from each sensor (sanitized)
-    for key, value in coordinator_data.items():
-        if key == "_metadata":
-            continue
-
-        if isinstance(value, dict):
-            # Sanitize sensor data - include structure but limit array sizes
-            sensor_info = {
-                "date": value.get("date"),
-                "day_offset": value.get("day_offset"),
-                "current": value.get("current"),
-                "min": value.get("min"),
-                "max": value.get("max"),
-                "avg": value.get("avg"),
-            }
-
-            # Include hourly data structure but limit to first few entries
-            hourly_data = value.get("hourly_data", {})
-            if hourly_data:
-                # Get first 3 and last 3 entries from the dict
-                items = list(hourly_data.items())
-                sensor_info["hourly_data_sample"] = {
-                    "count": len(items),
-                    "first_3": dict(items[:3]) if items else {},
-                    "last_3": dict(items[-3:]) if items else {},
-                }
-
-            diagnostics_data["sensors"][key] = sensor_info
-
     # Redact sensitive location data
     return async_redact_data(diagnostics_data, TO_REDACT)
+
+
+def _iso(timestamp: int) -> str:
+    """Return a UTC ISO timestamp."""
+    return dt_util.utc_from_timestamp(timestamp).isoformat()
+
+
+def _series_summary(series: ForecastSeries) -> dict[str, Any]:
+    """Summarize the shape of the forecast series."""
+    return {
+        "length": len(series),
+        "interval": series.interval,
+        "start": _iso(series.times[0]) if series else None,
+        "end": _iso(series.times[-1]) if series else None,
+        "compact": not isinstance(series.times, list),
+    }
+
+
+def _column_stats(series: ForecastSeries) -> dict[str, dict[str, Any]]:
+    """Return count, missing, min, max and mean for each series column."""
+    stats = {}
+    for metric, column in series.columns.items():
+        values = [value for value in column if not is_missing(value)]
+        stats[metric] = {
+            "count": len(values),
+            "missing": len(column) - len(values),
+            "min": min(values) if values else None,
+            "max": max(values) if values else None,
+            "mean": round(sum(values) / len(values), 3) if values else None,
+        }
+    return stats
+
+
+def _sample_payload(
+    coordinator_data: dict[str, Any], metrics: list[str]
+) -> dict[str, Any] | None:
+    """Return today's payload of the first metric as a representative sample."""
+    if not metrics or (payload := coordinator_data.get(f"{metrics[0]}_0")) is None:
+        return None
+    sample = {key: value for key, value in payload.items() if key != "hourly_data"}
+    if "hourly_data" in payload:
+        sample["hourly_data_count"] = len(payload["hourly_data"])
+    return {"key": f"{metrics[0]}_0", "payload": sample}
@@ -0,0 +1,20 @@
+"""Shared entity helpers for Open-Meteo CloudCover integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+
+from .const import CONF_NAME, DEFAULT_NAME, DOMAIN
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return device info to group all entities of a location under one device."""
+    location_name = entry.data.get(CONF_NAME, DEFAULT_NAME)
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"Open-Meteo CloudCover - {location_name}",
+        manufacturer="Open-Meteo",
+        model="CloudCover Station",
+        entry_type=DeviceEntryType.SERVICE,
+        configuration_url="https://open-meteo.com",
+    )
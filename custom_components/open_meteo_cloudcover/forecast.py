@@ -0,0 +1,470 @@
+"""Forecast storage and processing for Open-Meteo CloudCover integration."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, tzinfo
+import json
+import logging
+import math
+import operator
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR_SECONDS = 3600
+DAY_SECONDS = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def is_missing(value: float | None) -> bool:
+    """Return True for a missing value (None, or NaN in a compact column)."""
+    return value is None or value != value
+
+
+@dataclass(slots=True)
+class ForecastSeries:
+    """Forecast values stored as columns sharing one timestamp axis.
+
+    Timestamps are UTC epoch seconds, sorted ascending, each covering
+    ``interval`` seconds. Every column has one value per timestamp. Compact
+    series store columns as typed arrays with NaN for missing values.
+    """
+
+    interval: int
+    times: Sequence[int] = field(default_factory=list)
+    columns: dict[str, Sequence[float | None]] = field(default_factory=dict)
+
+    @classmethod
+    def from_block(
+        cls, block: dict[str, list], variables: list[str], interval: int
+    ) -> ForecastSeries:
+        """Build a series from an Open-Meteo ``unixtime`` response block."""
+        times = [int(t) for t in block.get("time", [])]
+        size = len(times)
+        columns = {}
+        for variable in variables:
+            values = block.get(variable) or []
+            # Pad short columns so every index lines up with ``times``
+            if len(values) < size:
+                values = list(values) + [None] * (size - len(values))
+            columns[variable] = list(values[:size])
+        return cls(interval=interval, times=times, columns=columns)
+
+    def __len__(self) -> int:
+        """Return the number of timestamps in the series."""
+        return len(self.times)
+
+    def index_at(self, timestamp: float) -> int | None:
+        """Return the index of the step containing ``timestamp``."""
+        idx = bisect_right(self.times, timestamp) - 1
+        if idx < 0 or timestamp - self.times[idx] >= self.interval:
+            return None
+        return idx
+
+    def value(self, metric: str, idx: int) -> float | None:
+        """Return the value of ``metric`` at ``idx``."""
+        column = self.columns.get(metric)
+        if column is None:
+            return None
+        value = column[idx]
+        return None if is_missing(value) else value
+
+    def value_at(self, metric: str, timestamp: float) -> float | None:
+        """Return the value of ``metric`` for the step containing ``timestamp``."""
+        idx = self.index_at(timestamp)
+        if idx is None:
+            return None
+        return self.value(metric, idx)
+
+    def latest(self, metric: str, timestamp: float) -> float | None:
+        """Return the last value of ``metric`` at or before ``timestamp``."""
+        for idx in range(bisect_right(self.times, timestamp) - 1, -1, -1):
+            if (value := self.value(metric, idx)) is not None:
+                return value
+        return None
+
+    def merge(self, other: ForecastSeries) -> ForecastSeries:
+        """Return a copy with the columns of ``other`` aligned to this axis.
+
+        Steps ``other`` has no value for are missing; columns of ``other``
+        replace same-named columns of this series.
+        """
+        positions = {timestamp: idx for idx, timestamp in enumerate(other.times)}
+        columns = dict(self.columns)
+        for metric, column in other.columns.items():
+            values = [
+                column[positions[timestamp]] if timestamp in positions else None
+                for timestamp in self.times
+            ]
+            if isinstance(self.times, array):
+                values = array(
+                    "d", [math.nan if value is None else value for value in values]
+                )
+            columns[metric] = values
+        return ForecastSeries(interval=self.interval, times=self.times, columns=columns)
+
+    def compact(self) -> ForecastSeries:
+        """Return a copy storing timestamps and columns as typed arrays."""
+        return ForecastSeries(
+            interval=self.interval,
+            times=array("q", self.times),
+            columns={
+                metric: array(
+                    "d", [math.nan if value is None else value for value in column]
+                )
+                for metric, column in self.columns.items()
+            },
+        )
+
+    def rows(
+        self, start: float | None = None, end: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the steps between ``start`` and ``end`` as row dicts."""
+        first = 0 if start is None else max(bisect_right(self.times, start) - 1, 0)
+        last = len(self.times) if end is None else bisect_right(self.times, end)
+        return [
+            {
+                "timestamp": self.times[idx],
+                **{metric: self.value(metric, idx) for metric in self.columns},
+            }
+            for idx in range(first, last)
+        ]
+
+
+def offset_table(zone: tzinfo, start: int, end: int) -> list[tuple[int, int]]:
+    """Return the UTC offsets in effect between two timestamps.
+
+    Each entry is ``(from_timestamp, offset_seconds)``. The zone is probed
+    once per day and transitions are located by bisection, so a whole
+    forecast horizon costs a handful of conversions.
+    """
+
+    def offset_at(timestamp: int) -> int:
+        return int(datetime.fromtimestamp(timestamp, zone).utcoffset().total_seconds())
+
+    table = [(start, offset_at(start))]
+    probe = start
+    while probe < end:
+        following = min(probe + DAY_SECONDS, end)
+        offset = offset_at(following)
+        if offset != table[-1][1]:
+            low, high = probe, following
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset_at(middle) == table[-1][1]:
+                    low = middle
+                else:
+                    high = middle
+            table.append((high, offset))
+        probe = following
+    return table
+
+
+def local_offsets(stamps: list[int], table: list[tuple[int, int]]) -> list[int]:
+    """Return the UTC offset for each sorted timestamp from an offset table."""
+    offsets = []
+    period = 0
+    for stamp in stamps:
+        while period + 1 < len(table) and stamp >= table[period + 1][0]:
+            period += 1
+        offsets.append(table[period][1])
+    return offsets
+
+
+def local_labels(
+    stamps: list[int], offsets: list[int]
+) -> tuple[list[str], list[date]]:
+    """Return local ``YYYY-MM-DDTHH:MM`` labels and dates for each timestamp.
+
+    A wall-clock hour repeated when DST ends gets its UTC offset appended to
+    the label so both hours are kept.
+    """
+    labels: list[str] = []
+    dates: list[date] = []
+    seen: set[str] = set()
+    day_cache: dict[int, date] = {}
+    for stamp, offset in zip(stamps, offsets):
+        day, seconds = divmod(stamp + offset, DAY_SECONDS)
+        if (local_date := day_cache.get(day)) is None:
+            local_date = day_cache[day] = date.fromordinal(EPOCH_ORDINAL + day)
+        label = (
+            f"{local_date.isoformat()}T{seconds // HOUR_SECONDS:02d}:"
+            f"{seconds % HOUR_SECONDS // 60:02d}"
+        )
+        if label in seen:
+            sign = "-" if offset < 0 else "+"
+            hours, minutes = divmod(abs(offset) // 60, 60)
+            label = f"{label}{sign}{hours:02d}:{minutes:02d}"
+        seen.add(label)
+        labels.append(label)
+        dates.append(local_date)
+    return labels, dates
+
+
+def process_forecast(
+    raw: bytes,
+    metrics: list[str],
+    now: datetime,
+    daylight_metrics: list[str] | None = None,
+    hour_offsets: Iterable[int] | None = None,
+    low_footprint: bool = False,
+) -> dict[str, Any]:
+    """Decode an hourly forecast response and aggregate it into sensor data.
+
+    This is a pure function over plain Python data so it can safely run in
+    an executor. The response must use ``timeformat=unixtime`` and ``now``
+    must be timezone-aware in the timezone the forecast was requested in.
+    """
+    data = json.loads(raw)
+    hourly = data.get("hourly", {})
+    times = hourly.get("time", [])
+
+    if not times:
+        raise ValueError("No data received from Open-Meteo API")
+
+    sensor_data = aggregate_hourly(
+        times, hourly, metrics, now, daylight_metrics, hour_offsets, low_footprint
+    )
+
+    # Add metadata
+    sensor_data["_metadata"] = {
+        "latitude": data.get("latitude"),
+        "longitude": data.get("longitude"),
+        "timezone": data.get("timezone"),
+        "elevation": data.get("elevation"),
+    }
+
+    return sensor_data
+
+
+def reaggregate_series(
+    series: ForecastSeries,
+    metrics: list[str],
+    now: datetime,
+    daylight_metrics: list[str] | None = None,
+    hour_offsets: Iterable[int] | None = None,
+    low_footprint: bool = False,
+) -> dict[str, Any]:
+    """Re-derive sensor data from a cached hourly series for a later ``now``.
+
+    Lets hour-relative values follow the clock between fetches. Only the
+    given metrics and the ``is_day`` flags are taken from the series.
+    """
+    hourly = {
+        metric: [series.value(metric, idx) for idx in range(len(series))]
+        for metric in [*metrics, "is_day"]
+        if metric in series.columns
+    }
+    return aggregate_hourly(
+        list(series.times),
+        hourly,
+        metrics,
+        now,
+        daylight_metrics,
+        hour_offsets,
+        low_footprint,
+    )
+
+
+def aggregate_hourly(
+    times: list[int],
+    hourly: dict[str, list],
+    metrics: list[str],
+    now: datetime,
+    daylight_metrics: list[str] | None = None,
+    hour_offsets: Iterable[int] | None = None,
+    low_footprint: bool = False,
+) -> dict[str, Any]:
+    """Group hourly forecast data by day for each metric.
+
+    Metrics listed in ``daylight_metrics`` also get daylight-only daily
+    aggregates, masked by the ``is_day`` flags in ``hourly``. Only the
+    ``hour_offsets`` given (default 1-24) get hourly sensor data. In low
+    footprint mode the series is stored as typed arrays and daily sensor
+    data omits the per-hour ``hourly_data`` dicts.
+    """
+    daylight_metrics = daylight_metrics or []
+    if hour_offsets is None:
+        hour_offsets = range(1, 25)
+
+    # Timestamps are UTC epoch seconds; local dates and labels come from an
+    # offset table for the horizon rather than per-hour datetime conversion
+    stamps = [int(stamp) for stamp in times]
+    size = len(stamps)
+    offsets = local_offsets(stamps, offset_table(now.tzinfo, stamps[0], stamps[-1]))
+    labels, dates = local_labels(stamps, offsets)
+
+    columns = {}
+    for metric in metrics:
+        values = hourly.get(metric) or []
+        columns[metric] = [
+            values[idx] if idx < len(values) else None for idx in range(size)
+        ]
+
+    # Daylight mask from the is_day flags fetched alongside the metrics
+    is_day = hourly.get("is_day") or []
+    daylight = [bool(is_day[idx]) if idx < len(is_day) else False for idx in range(size)]
+
+    series = ForecastSeries(
+        interval=HOUR_SECONDS,
+        times=stamps,
+        columns={**columns, "is_day": [int(flag) for flag in daylight]},
+    )
+    if low_footprint:
+        series = series.compact()
+
+    # This hour = the hour block we're currently in (e.g., at 11:30, use 11:00)
+    # Next hour = the next hour block (e.g., at 11:30, use 12:00)
+    # Hours are matched by exact integer comparison of epoch seconds, so DST
+    # changes never produce duplicate or missing hours
+    now_ts = int(now.timestamp())
+    this_hour_idx = series.index_at(now_ts)
+    next_hour_idx = series.index_at(now_ts + HOUR_SECONDS)
+
+    # Hours 1-24 from current time
+    hour_offset_idx = {
+        hour_offset: series.index_at(now_ts + hour_offset * HOUR_SECONDS)
+        for hour_offset in hour_offsets
+    }
+
+    # Use current date (today) as the reference for day offset calculation
+    today = now.date()
+    sensor_data: dict[str, Any] = {"_series": series}
+
+    for metric, column in columns.items():
+        present = [idx for idx, value in enumerate(column) if value is not None]
+        if not present:
+            continue
+
+        # This hour falls back to the last available hour when not found
+        this_hour_value = None
+        if this_hour_idx is not None:
+            this_hour_value = column[this_hour_idx]
+        if this_hour_value is None:
+            this_hour_value = column[present[-1]]
+        sensor_data[f"{metric}_this_hour"] = {
+            "value": this_hour_value,
+            "type": "this_hour",
+        }
+
+        if next_hour_idx is not None and column[next_hour_idx] is not None:
+            sensor_data[f"{metric}_next_hour"] = {
+                "value": column[next_hour_idx],
+                "type": "next_hour",
+            }
+
+        # Daily aggregates keyed by day offset (0=today, 1=tomorrow, etc.)
+        by_date: dict[date, list[int]] = defaultdict(list)
+        for idx in present:
+            by_date[dates[idx]].append(idx)
+
+        for date_key in sorted(by_date):
+            indices = by_date[date_key]
+            day_offset = (date_key - today).days
+            values = [column[idx] for idx in indices]
+
+            if day_offset == 0:
+                # Value for the current or next hour, else the last hour of today
+                current_value = next(
+                    (column[idx] for idx in indices if stamps[idx] >= now_ts),
+                    values[-1],
+                )
+            else:
+                # For future days, use first hour of the day
+                current_value = values[0]
+
+            day_data = {
+                "date": str(date_key),
+                "day_offset": day_offset,
+                "current": current_value,
+                "min": round(min(values), 2),
+                "max": round(max(values), 2),
+                "avg": round(sum(values) / len(values), 2),
+            }
+            if not low_footprint:
+                day_data["hourly_data"] = {labels[idx]: column[idx] for idx in indices}
+
+            # Daylight-only aggregates ignore night hours for solar use
+            if metric in daylight_metrics:
+                daylight_values = [column[idx] for idx in indices if daylight[idx]]
+                day_data["daylight_hours"] = len(daylight_values)
+                if daylight_values:
+                    day_data["daylight_avg"] = round(
+                        sum(daylight_values) / len(daylight_values), 2
+                    )
+                    day_data["daylight_max"] = round(max(daylight_values), 2)
+                    day_data["daylight_sum"] = round(sum(daylight_values), 2)
+
+            sensor_data[f"{metric}_{day_offset}"] = day_data
+
+        for hour_offset, idx in hour_offset_idx.items():
+            if idx is not None and column[idx] is not None:
+                sensor_data[f"{metric}_hour_{hour_offset}"] = {
+                    "value": column[idx],
+                    "hour_offset": hour_offset,
+                    "type": "hourly",
+                }
+
+    return sensor_data
+
+
+def first_crossing(
+    series: ForecastSeries,
+    metric: str,
+    comparison: str,
+    threshold: float,
+    start: float,
+    window_hours: int,
+) -> int | None:
+    """Return the first timestamp in a window where a metric crosses a threshold.
+
+    The window runs from the step containing ``start`` for ``window_hours``.
+    ``comparison`` is ``"below"`` or ``"above"``; missing values never match.
+    """
+    column = series.columns.get(metric)
+    if column is None or not series.times:
+        return None
+
+    compare = operator.lt if comparison == "below" else operator.gt
+    first = max(bisect_right(series.times, start) - 1, 0)
+    last = bisect_right(series.times, start + window_hours * HOUR_SECONDS - 1)
+
+    # Compare the whole window slice at once, skipping missing values
+    matches = [
+        not is_missing(value) and compare(value, threshold)
+        for value in column[first:last]
+    ]
+    if True not in matches:
+        return None
+    return series.times[first + matches.index(True)]
+
+
+def evaluate_alerts(
+    series: ForecastSeries, rules: list[dict[str, Any]], start: float
+) -> dict[str, dict[str, Any]]:
+    """Evaluate threshold rules against a series.
+
+    Returns the first crossing timestamp and value for each rule id, or
+    ``None`` values when the rule is not triggered within its window.
+    """
+    alerts = {}
+    for rule in rules:
+        crossing = first_crossing(
+            series,
+            rule["metric"],
+            rule["comparison"],
+            rule["threshold"],
+            start,
+            rule["window_hours"],
+        )
+        alerts[rule["id"]] = {
+            "first_crossing": crossing,
+            "value": None
+            if crossing is None
+            else series.value_at(rule["metric"], crossing),
+        }
+    return alerts
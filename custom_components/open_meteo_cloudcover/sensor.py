@@ -6,17 +6,33 @@ import logging
 from typing import Any
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME, DEFAULT_NAME, DOMAIN, SENSOR_TYPES, get_day_name
-from .coordinator import OpenMeteoDataUpdateCoordinator
+from .api import async_get_client
+from .const import (
+    CONF_FORECAST_ATTRIBUTES,
+    CONF_HOURLY_SENSORS,
+    DEFAULT_FORECAST_ATTRIBUTES,
+    DEFAULT_HOURLY_SENSORS,
+    DOMAIN,
+    MINUTELY_15_SENSOR_TYPES,
+    SENSOR_TYPES,
+    SIGNAL_OPTIONS_UPDATED,
+    SOURCE_SENSOR_TYPES,
+    get_day_name,
+)
+from .coordinator import OpenMeteoDataUpdateCoordinator, OpenMeteoMinutelyCoordinator
+from .entity import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,12 +45,64 @@ async def async_setup_entry(
     """Set up Open-Meteo CloudCover sensor entities."""
     coordinator: OpenMeteoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Get the forecast days from coordinator (fixed at 7)
+    # The budget is domain-wide, so only the first entry shows it
+    if not _owns_budget_sensor(hass, entry):
+        registry = er.async_get(hass)
+        entity_id = registry.async_get_entity_id(
+            SENSOR_DOMAIN, DOMAIN, f"{entry.entry_id}_api_budget"
+        )
+        if entity_id is not None:
+            registry.async_remove(entity_id)
+
+    entities = _build_entities(coordinator, entry)
+    added = {entity.unique_id for entity in entities}
+    async_add_entities(entities)
+
+    @callback
+    def _async_options_updated() -> None:
+        """Add and remove only the sensors affected by changed options."""
+        wanted = {
+            entity.unique_id: entity for entity in _build_entities(coordinator, entry)
+        }
+
+        # Removing the registry entry also removes the entity from its platform
+        registry = er.async_get(hass)
+        for unique_id in added - wanted.keys():
+            entity_id = registry.async_get_entity_id(SENSOR_DOMAIN, DOMAIN, unique_id)
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+
+        new_entities = [
+            entity for unique_id, entity in wanted.items() if unique_id not in added
+        ]
+        added.clear()
+        added.update(wanted)
+        if new_entities:
+            async_add_entities(new_entities)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_OPTIONS_UPDATED}_{entry.entry_id}", _async_options_updated
+        )
+    )
+
+
+def _owns_budget_sensor(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Return True if this entry provides the domain-wide budget sensor."""
+    entries = hass.config_entries.async_entries(DOMAIN)
+    return bool(entries) and entries[0].entry_id == entry.entry_id
+
+
+def _build_entities(
+    coordinator: OpenMeteoDataUpdateCoordinator, entry: ConfigEntry
+) -> list[SensorEntity]:
+    """Build the sensor entities the entry's current options call for."""
     forecast_days = coordinator.forecast_days
+    hourly_sensors = entry.options.get(CONF_HOURLY_SENSORS, DEFAULT_HOURLY_SENSORS)
 
     # Create sensor entities for each sensor type and each day
-    entities = []
-    for sensor_type in SENSOR_TYPES:
+    entities: list[SensorEntity] = []
+    for sensor_type in coordinator.metrics:
         # Create "This Hour" and "Next Hour" sensors
         entities.append(
             OpenMeteoSensor(
@@ -55,8 +123,8 @@ async def async_setup_entry(
             )
         )
 
-        # Create hourly sensors (hours 1-24, disabled by default)
-        for hour_offset in range(1, 25):
+        # Create hourly sensors (hours 1-24 by default, disabled by default)
+        for hour_offset in range(1, hourly_sensors + 1):
             entities.append(
                 OpenMeteoSensor(
                     coordinator=coordinator,
@@ -80,7 +148,38 @@ async def async_setup_entry(
                 )
             )
 
-    async_add_entities(entities)
+    # Create "This 15 Min" and "Next 15 Min" sensors in high resolution mode
+    if coordinator.minutely is not None:
+        for sensor_type in MINUTELY_15_SENSOR_TYPES:
+            for special_type in ("this_15min", "next_15min"):
+                entities.append(
+                    OpenMeteoSensor(
+                        coordinator=coordinator.minutely,
+                        entry=entry,
+                        sensor_type=sensor_type,
+                        day_offset=None,
+                        special_type=special_type,
+                    )
+                )
+
+    # Create "Latest" sensors for the columns of enabled extra sources
+    for source in coordinator.sources:
+        for sensor_type in source.columns:
+            entities.append(
+                OpenMeteoSensor(
+                    coordinator=coordinator,
+                    entry=entry,
+                    sensor_type=sensor_type,
+                    day_offset=None,
+                    special_type="latest",
+                )
+            )
+
+    # Diagnostic sensor for the domain-wide API call budget
+    if _owns_budget_sensor(coordinator.hass, entry):
+        entities.append(OpenMeteoBudgetSensor(coordinator=coordinator, entry=entry))
+
+    return entities
 
 
 class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
@@ -88,7 +187,7 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: OpenMeteoDataUpdateCoordinator,
+        coordinator: OpenMeteoDataUpdateCoordinator | OpenMeteoMinutelyCoordinator,
         entry: ConfigEntry,
         sensor_type: str,
         day_offset: int | None,
@@ -102,9 +201,14 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
         self._day_offset = day_offset
         self._special_type = special_type
         self._hour_offset = hour_offset
+        self._entry = entry
+
+        self._sensor_info = SENSOR_TYPES.get(sensor_type) or SOURCE_SENSOR_TYPES[
+            sensor_type
+        ]
 
         # Build sensor key and name based on type
-        base_name = SENSOR_TYPES[sensor_type]["name"]
+        base_name = self._sensor_info["name"]
 
         if special_type == "this_hour":
             self._sensor_key = f"{sensor_type}_this_hour"
@@ -114,6 +218,18 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
             self._sensor_key = f"{sensor_type}_next_hour"
             self._attr_name = f"{base_name} Next Hour"
             self._attr_unique_id = f"{entry.entry_id}_{sensor_type}_next_hour"
+        elif special_type == "this_15min":
+            self._sensor_key = f"{sensor_type}_this_15min"
+            self._attr_name = f"{base_name} This 15 Min"
+            self._attr_unique_id = f"{entry.entry_id}_{sensor_type}_this_15min"
+        elif special_type == "next_15min":
+            self._sensor_key = f"{sensor_type}_next_15min"
+            self._attr_name = f"{base_name} Next 15 Min"
+            self._attr_unique_id = f"{entry.entry_id}_{sensor_type}_next_15min"
+        elif special_type == "latest":
+            self._sensor_key = f"{sensor_type}_latest"
+            self._attr_name = f"{base_name} Latest"
+            self._attr_unique_id = f"{entry.entry_id}_{sensor_type}_latest"
         elif special_type == "hourly":
             self._sensor_key = f"{sensor_type}_hour_{hour_offset}"
             self._attr_name = f"{base_name} Hour {hour_offset}"
@@ -125,15 +241,15 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
             self._attr_name = f"{base_name} {day_name}"
             self._attr_unique_id = f"{entry.entry_id}_{sensor_type}_{day_offset}"
 
-        self._attr_icon = SENSOR_TYPES[sensor_type]["icon"]
+        self._attr_icon = self._sensor_info["icon"]
 
         # Set device class if available
-        if SENSOR_TYPES[sensor_type]["device_class"]:
-            self._attr_device_class = SENSOR_TYPES[sensor_type]["device_class"]
+        if self._sensor_info["device_class"]:
+            self._attr_device_class = self._sensor_info["device_class"]
 
         # Set state class
-        if SENSOR_TYPES[sensor_type]["state_class"]:
-            self._attr_state_class = SENSOR_TYPES[sensor_type]["state_class"]
+        if self._sensor_info["state_class"]:
+            self._attr_state_class = self._sensor_info["state_class"]
 
         # Disable by default for:
         # - cloud_cover_low, cloud_cover_mid, cloud_cover_high
@@ -147,15 +263,7 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
             self._attr_entity_registry_enabled_default = False
 
         # Device info to group all sensors under one device
-        location_name = entry.data.get(CONF_NAME, DEFAULT_NAME)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"Open-Meteo CloudCover - {location_name}",
-            manufacturer="Open-Meteo",
-            model="CloudCover Station",
-            entry_type=DeviceEntryType.SERVICE,
-            configuration_url="https://open-meteo.com",
-        )
+        self._attr_device_info = device_info(entry)
 
     @property
     def native_value(self) -> float | None:
@@ -163,8 +271,15 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data:
             sensor_data = self.coordinator.data.get(self._sensor_key)
             if sensor_data:
-                # For this_hour, next_hour, and hourly sensors, return the value directly
-                if self._special_type in ("this_hour", "next_hour", "hourly"):
+                # For this_hour, next_hour, hourly, 15-minute and latest sensors, return the value directly
+                if self._special_type in (
+                    "this_hour",
+                    "next_hour",
+                    "hourly",
+                    "this_15min",
+                    "next_15min",
+                    "latest",
+                ):
                     return sensor_data.get("value")
                 # For day-based sensors, return daily average
                 return sensor_data.get("avg")
@@ -173,7 +288,7 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement."""
-        return SENSOR_TYPES[self._sensor_type]["unit"]
+        return self._sensor_info["unit"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -184,8 +299,15 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
         sensor_data = self.coordinator.data.get(self._sensor_key, {})
         metadata = self.coordinator.data.get("_metadata", {})
 
-        # For this_hour, next_hour, and hourly sensors, return minimal attributes
-        if self._special_type in ("this_hour", "next_hour", "hourly"):
+        # For this_hour, next_hour, hourly, 15-minute and latest sensors, return minimal attributes
+        if self._special_type in (
+            "this_hour",
+            "next_hour",
+            "hourly",
+            "this_15min",
+            "next_15min",
+            "latest",
+        ):
             attributes = {
                 "latitude": metadata.get("latitude"),
                 "longitude": metadata.get("longitude"),
@@ -209,13 +331,24 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
         }
 
         # Add hourly forecast data for this day
+        # (not kept in low footprint mode)
         hourly_data = sensor_data.get("hourly_data", {})
-        if hourly_data:
+        if hourly_data and self._entry.options.get(
+            CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+        ):
             attributes["forecast_data"] = hourly_data
+        if "avg" in sensor_data:
             attributes["min"] = sensor_data.get("min")
             attributes["max"] = sensor_data.get("max")
             attributes["avg"] = sensor_data.get("avg")
 
+        # Add daylight-only aggregates for solar-relevant metrics
+        if "daylight_hours" in sensor_data:
+            attributes["daylight_hours"] = sensor_data.get("daylight_hours")
+            attributes["daylight_avg"] = sensor_data.get("daylight_avg")
+            attributes["daylight_max"] = sensor_data.get("daylight_max")
+            attributes["daylight_sum"] = sensor_data.get("daylight_sum")
+
         return attributes
 
     @property
@@ -226,3 +359,46 @@ class OpenMeteoSensor(CoordinatorEntity, SensorEntity):
             and self.coordinator.data is not None
             and self._sensor_key in self.coordinator.data
         )
+
+
+class OpenMeteoBudgetSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor showing the remaining Open-Meteo API call budget."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:api"
+    _attr_native_unit_of_measurement = "calls"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: OpenMeteoDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+
+        self._budget = async_get_client(coordinator.hass).budget
+        self._attr_name = "API Budget Remaining"
+        self._attr_unique_id = f"{entry.entry_id}_api_budget"
+        self._attr_device_info = device_info(entry)
+
+    @property
+    def native_value(self) -> float:
+        """Return the API calls remaining in the daily quota."""
+        return round(self._budget.daily.tokens, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {
+            "daily_limit": self._budget.daily.capacity,
+            "minute_remaining": round(self._budget.minute.tokens, 1),
+            "minute_limit": self._budget.minute.capacity,
+            "spent": round(self._budget.spent, 2),
+            "deferred_requests": self._budget.deferred,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return True
@@ -0,0 +1,85 @@
+"""Additional Open-Meteo data sources for Open-Meteo CloudCover integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    AIR_QUALITY_API_URL,
+    SATELLITE_API_URL,
+    SOURCE_AIR_QUALITY,
+    SOURCE_SATELLITE_RADIATION,
+)
+from .forecast import HOUR_SECONDS, ForecastSeries
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastSource:
+    """An Open-Meteo API fetched alongside the forecast on its own cadence.
+
+    ``variables`` are requested from the source's ``hourly`` block and stored
+    as ``prefix + variable`` columns in the coordinator's series.
+    """
+
+    key: str
+    name: str
+    url: str
+    variables: tuple[str, ...]
+    update_interval: timedelta
+    past_days: int = 0
+    forecast_days: int = 0
+    prefix: str = ""
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the series columns this source provides."""
+        return [f"{self.prefix}{variable}" for variable in self.variables]
+
+    def build_params(
+        self, latitude: float, longitude: float, now: datetime, timezone: str
+    ) -> dict[str, Any]:
+        """Build the request parameters for this source."""
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "start_date": (now - timedelta(days=self.past_days)).strftime("%Y-%m-%d"),
+            "end_date": (now + timedelta(days=self.forecast_days)).strftime(
+                "%Y-%m-%d"
+            ),
+            "timezone": timezone,
+            "timeformat": "unixtime",
+            "hourly": ",".join(self.variables),
+        }
+
+    def parse(self, data: dict[str, Any]) -> ForecastSeries:
+        """Build a series with prefixed columns from a decoded response."""
+        series = ForecastSeries.from_block(
+            data.get("hourly", {}), list(self.variables), HOUR_SECONDS
+        )
+        series.columns = {
+            f"{self.prefix}{variable}": column
+            for variable, column in series.columns.items()
+        }
+        return series
+
+
+SOURCES: dict[str, ForecastSource] = {
+    SOURCE_AIR_QUALITY: ForecastSource(
+        key=SOURCE_AIR_QUALITY,
+        name="Air quality (aerosols)",
+        url=AIR_QUALITY_API_URL,
+        variables=("aerosol_optical_depth", "dust"),
+        update_interval=timedelta(hours=3),
+        forecast_days=4,
+    ),
+    SOURCE_SATELLITE_RADIATION: ForecastSource(
+        key=SOURCE_SATELLITE_RADIATION,
+        name="Satellite radiation",
+        url=SATELLITE_API_URL,
+        variables=("shortwave_radiation", "direct_radiation"),
+        update_interval=timedelta(minutes=30),
+        past_days=1,
+        prefix="satellite_",
+    ),
+}
@@ -0,0 +1,67 @@
+"""Long-term statistics for Open-Meteo CloudCover forecasts."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, SENSOR_TYPES
+from .forecast import HOUR_SECONDS, ForecastSeries, is_missing
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def statistic_id(statistic_prefix: str, metric: str) -> str:
+    """Return the external statistic id for a location's metric forecast."""
+    return f"{DOMAIN}:{slugify(statistic_prefix)}_{metric}_forecast"
+
+
+@callback
+def async_import_forecast_statistics(
+    hass: HomeAssistant,
+    statistic_prefix: str,
+    location_name: str,
+    series: ForecastSeries,
+) -> None:
+    """Write an issued hourly forecast to long-term statistics.
+
+    Each forecast hour becomes one statistics row per metric, so the newest
+    issued forecast replaces the rows of earlier ones for the same hours.
+    Each metric is queued to the recorder as its own import task.
+    """
+    if "recorder" not in hass.config.components:
+        return
+
+    # Statistics rows must start on a UTC hour boundary
+    starts = [
+        dt_util.utc_from_timestamp(timestamp - timestamp % HOUR_SECONDS)
+        for timestamp in series.times
+    ]
+
+    for metric, sensor_type in SENSOR_TYPES.items():
+        column = series.columns.get(metric)
+        if not column:
+            continue
+
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{location_name} {sensor_type['name']} Forecast",
+            source=DOMAIN,
+            statistic_id=statistic_id(statistic_prefix, metric),
+            unit_of_measurement=sensor_type["unit"],
+        )
+        statistics = [
+            StatisticData(start=start, mean=value, min=value, max=value)
+            for start, value in zip(starts, column)
+            if not is_missing(value)
+        ]
+        if statistics:
+            async_add_external_statistics(hass, metadata, statistics)
+
+    _LOGGER.debug(
+        "Queued %s hours of forecast statistics for %s", len(starts), location_name
+    )
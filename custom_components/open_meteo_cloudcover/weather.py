@@ -0,0 +1,186 @@
+"""Weather platform for Open-Meteo CloudCover integration."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date
+import logging
+from typing import Any
+
+from homeassistant.components.weather import (
+    ATTR_CONDITION_CLEAR_NIGHT,
+    ATTR_CONDITION_CLOUDY,
+    ATTR_CONDITION_PARTLYCLOUDY,
+    ATTR_CONDITION_SUNNY,
+    Forecast,
+    WeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import OpenMeteoDataUpdateCoordinator
+from .entity import device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+# Cloud cover (%) below which the sky is reported as clear / partly cloudy
+CLEAR_SKY_THRESHOLD = 20
+PARTLY_CLOUDY_THRESHOLD = 70
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Open-Meteo CloudCover weather entity."""
+    coordinator: OpenMeteoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities([OpenMeteoWeather(coordinator=coordinator, entry=entry)])
+
+
+def _condition(cloud_cover: float | None, is_day: bool = True) -> str | None:
+    """Map cloud cover to a weather condition."""
+    if cloud_cover is None:
+        return None
+    if cloud_cover < CLEAR_SKY_THRESHOLD:
+        return ATTR_CONDITION_SUNNY if is_day else ATTR_CONDITION_CLEAR_NIGHT
+    if cloud_cover < PARTLY_CLOUDY_THRESHOLD:
+        return ATTR_CONDITION_PARTLYCLOUDY
+    return ATTR_CONDITION_CLOUDY
+
+
+class OpenMeteoWeather(CoordinatorEntity, WeatherEntity):
+    """Weather entity serving forecasts from the coordinator's series."""
+
+    _attr_supported_features = (
+        WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
+    )
+
+    def __init__(
+        self,
+        coordinator: OpenMeteoDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the weather entity."""
+        super().__init__(coordinator)
+
+        self._attr_name = "Cloud Cover Forecast"
+        self._attr_unique_id = f"{entry.entry_id}_weather"
+
+        # Last forecasts pushed to subscribers
+        self._hourly_forecast: list[Forecast] | None = None
+        self._daily_forecast: list[Forecast] | None = None
+
+        # Device info to group all entities under one device
+        self._attr_device_info = device_info(entry)
+
+    @property
+    def available(self) -> bool:
+        """Return False while cloud cover is not among the fetched metrics."""
+        return super().available and "cloud_cover" in self.coordinator.metrics
+
+    def _current(self, key: str) -> Any:
+        """Return a this-hour value from the coordinator data."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(key, {}).get("value")
+
+    @property
+    def cloud_coverage(self) -> float | None:
+        """Return the cloud coverage of the current hour."""
+        return self._current("cloud_cover_this_hour")
+
+    @property
+    def condition(self) -> str | None:
+        """Return the condition of the current hour."""
+        series = (self.coordinator.data or {}).get("_series")
+        is_day = True
+        if series is not None:
+            is_day = bool(series.value_at("is_day", dt_util.utcnow().timestamp()))
+        return _condition(self.cloud_coverage, is_day)
+
+    def _build_hourly_forecast(self) -> list[Forecast]:
+        """Build the hourly forecast from the current hour onwards."""
+        series = (self.coordinator.data or {}).get("_series")
+        if series is None:
+            return []
+
+        # Read only the two columns used, starting at the current hour
+        first = max(bisect_right(series.times, dt_util.utcnow().timestamp()) - 1, 0)
+        forecast: list[Forecast] = []
+        for idx in range(first, len(series)):
+            cloud_cover = series.value("cloud_cover", idx)
+            is_day = series.value("is_day", idx)
+            forecast.append(
+                Forecast(
+                    datetime=dt_util.utc_from_timestamp(series.times[idx]).isoformat(),
+                    cloud_coverage=cloud_cover,
+                    # Hours without an is_day flag count as daytime
+                    condition=_condition(cloud_cover, is_day != 0),
+                )
+            )
+        return forecast
+
+    def _build_daily_forecast(self) -> list[Forecast]:
+        """Build the daily forecast from the daily cloud cover aggregates."""
+        data = self.coordinator.data or {}
+
+        forecast: list[Forecast] = []
+        day_offset = 0
+        while (day := data.get(f"cloud_cover_{day_offset}")) is not None:
+            start = dt_util.start_of_local_day(date.fromisoformat(day["date"]))
+            forecast.append(
+                Forecast(
+                    datetime=start.isoformat(),
+                    cloud_coverage=day.get("avg"),
+                    # Judge the day by its daylight hours where available
+                    condition=_condition(day.get("daylight_avg", day.get("avg"))),
+                )
+            )
+            day_offset += 1
+        return forecast
+
+    @callback
+    def _async_refresh_forecasts(self) -> list[str]:
+        """Rebuild the forecasts and return the types that changed."""
+        changed = []
+
+        hourly = self._build_hourly_forecast()
+        if hourly != self._hourly_forecast:
+            self._hourly_forecast = hourly
+            changed.append("hourly")
+
+        daily = self._build_daily_forecast()
+        if daily != self._daily_forecast:
+            self._daily_forecast = daily
+            changed.append("daily")
+
+        return changed
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data and notify forecast subscribers of changes."""
+        changed = self._async_refresh_forecasts()
+        super()._handle_coordinator_update()
+
+        # Only push forecast types whose content actually changed
+        if changed:
+            self.hass.async_create_task(self.async_update_listeners(changed))
+
+    async def async_added_to_hass(self) -> None:
+        """Build the initial forecasts when added to Home Assistant."""
+        await super().async_added_to_hass()
+        self._async_refresh_forecasts()
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast."""
+        return self._hourly_forecast
+
+    async def async_forecast_daily(self) -> list[Forecast] | None:
+        """Return the daily forecast."""
+        return self._daily_forecast
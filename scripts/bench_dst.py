@@ -0,0 +1,90 @@
+"""Time local hour labelling across DST changes.
+
+Compares the offset table used by forecast.py with converting every hour to
+a local datetime, over a 7 day hourly horizon that contains the Europe/Berlin
+spring-forward (23 hour) or fall-back (25 hour) day. Both paths are checked
+to give the same local dates and hours before timing. forecast.py is loaded
+by path, so this runs without Home Assistant installed:
+
+    python scripts/bench_dst.py
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+import importlib.util
+from pathlib import Path
+import sys
+import timeit
+from zoneinfo import ZoneInfo
+
+PACKAGE = Path(__file__).resolve().parents[1] / "custom_components" / "open_meteo_cloudcover"
+
+ZONE = ZoneInfo("Europe/Berlin")
+HOURS = 8 * 24
+NUMBER = 200
+# Horizons starting at local midnight the day before each change
+CASES = {
+    "spring forward": (2025, 3, 29),
+    "fall back": (2025, 10, 25),
+}
+
+
+def load_forecast():
+    """Import forecast.py without importing the integration package."""
+    spec = importlib.util.spec_from_file_location("forecast", PACKAGE / "forecast.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["forecast"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def table_labels(forecast, stamps: list[int]) -> tuple[list[str], list[date]]:
+    """Label the hours from an offset table, as process_forecast does."""
+    table = forecast.offset_table(ZONE, stamps[0], stamps[-1])
+    return forecast.local_labels(stamps, forecast.local_offsets(stamps, table))
+
+
+def per_hour_labels(stamps: list[int]) -> tuple[list[str], list[date]]:
+    """Label the hours by converting each one to a local datetime."""
+    labels: list[str] = []
+    dates: list[date] = []
+    seen: set[str] = set()
+    for stamp in stamps:
+        local = datetime.fromtimestamp(stamp, ZONE)
+        label = local.strftime("%Y-%m-%dT%H:%M")
+        if label in seen:
+            label = f"{label}{local.isoformat()[-6:]}"
+        seen.add(label)
+        labels.append(label)
+        dates.append(local.date())
+    return labels, dates
+
+
+def main() -> None:
+    """Print the time per horizon for both paths on each DST day."""
+    forecast = load_forecast()
+    print(f"{HOURS} hours, best of 5 x {NUMBER} runs")
+    for label, first_day in CASES.items():
+        start = int(datetime(*first_day, tzinfo=ZONE).timestamp())
+        stamps = [start + 3600 * hour for hour in range(HOURS)]
+
+        expected = per_hour_labels(stamps)
+        assert table_labels(forecast, stamps) == expected
+        day_hours = expected[1].count(expected[1][24])
+
+        timings = {
+            "offset table": lambda: table_labels(forecast, stamps),
+            "per hour": lambda: per_hour_labels(stamps),
+        }
+        results = {
+            name: min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+            for name, func in timings.items()
+        }
+        print(f"{label} ({day_hours} hour day):")
+        for name, seconds in results.items():
+            print(f"{name:>14}: {seconds * 1e6:8.1f} µs")
+        print(f"{'speedup':>14}: {results['per hour'] / results['offset table']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
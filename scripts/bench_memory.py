@@ -0,0 +1,117 @@
+"""Measure the memory retained by processed forecast data.
+
+Compares the sensor data kept by the coordinator for a 7 day hourly forecast
+with and without low footprint mode. Low footprint mode is measured with the
+horizon the default enabled entities need: no Hour N sensors, and the full
+7 days while the weather entity is enabled or days 0-2 once it is disabled.
+forecast.py is loaded by path, so this runs without Home Assistant installed:
+
+    python scripts/bench_memory.py
+"""
+from __future__ import annotations
+
+import gc
+import importlib.util
+import json
+import math
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+PACKAGE = Path(__file__).resolve().parents[1] / "custom_components" / "open_meteo_cloudcover"
+
+METRICS = [
+    "evapotranspiration",
+    "soil_temperature_0cm",
+    "soil_moisture_0_to_1cm",
+    "et0_fao_evapotranspiration",
+    "cloud_cover",
+    "cloud_cover_low",
+    "cloud_cover_mid",
+    "cloud_cover_high",
+    "direct_radiation",
+]
+DAYLIGHT_METRICS = [
+    "cloud_cover",
+    "cloud_cover_low",
+    "cloud_cover_mid",
+    "cloud_cover_high",
+    "direct_radiation",
+]
+FORECAST_DAYS = 7
+# (label, forecast days, hour offsets, low footprint) per measured case
+CASES = [
+    ("default", FORECAST_DAYS, None, False),
+    ("low footprint", FORECAST_DAYS, [], True),
+    ("no weather", 2, [], True),
+]
+ZONE = ZoneInfo("Europe/Berlin")
+
+
+def load_forecast():
+    """Import forecast.py without importing the integration package."""
+    spec = importlib.util.spec_from_file_location("forecast", PACKAGE / "forecast.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["forecast"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_response(start: datetime, forecast_days: int) -> bytes:
+    """Synthesize an hourly response like Open-Meteo returns it."""
+    hours = (forecast_days + 1) * 24
+    first = int(start.timestamp())
+    hourly: dict[str, list] = {"time": [first + 3600 * hour for hour in range(hours)]}
+    for offset, metric in enumerate(METRICS):
+        hourly[metric] = [
+            round(50 + 40 * math.sin((hour + offset) / 5), 2) for hour in range(hours)
+        ]
+    hourly["is_day"] = [int(6 <= hour % 24 < 20) for hour in range(hours)]
+    return json.dumps(
+        {"timezone": str(ZONE), "hourly": hourly}, separators=(",", ":")
+    ).encode()
+
+
+def retained_bytes(
+    forecast,
+    raw: bytes,
+    now: datetime,
+    hour_offsets: list[int] | None,
+    low_footprint: bool,
+) -> int:
+    """Return the bytes still allocated once the sensor data is built."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    sensor_data = forecast.process_forecast(
+        raw, METRICS, now, DAYLIGHT_METRICS, hour_offsets, low_footprint
+    )
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del sensor_data
+    return retained
+
+
+def main() -> None:
+    """Print the retained size of the sensor data for each case."""
+    forecast = load_forecast()
+    start = datetime.now(ZONE).replace(hour=0, minute=0, second=0, microsecond=0)
+    now = start + timedelta(hours=12, minutes=30)
+
+    print(f"{len(METRICS)} metrics, {FORECAST_DAYS} forecast days")
+    baseline = None
+    for label, forecast_days, hour_offsets, low_footprint in CASES:
+        raw = build_response(start, forecast_days)
+        size = retained_bytes(forecast, raw, now, hour_offsets, low_footprint)
+        baseline = baseline or size
+        print(
+            f"{label:>14}: {size / 1024:8.1f} KB retained "
+            f"({len(raw) / 1024:.1f} KB response, {1 - size / baseline:.0%} saved)"
+        )
+
+
+if __name__ == "__main__":
+    main()
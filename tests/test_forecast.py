@@ -0,0 +1,104 @@
+"""DST tests for the forecast aggregation in Open-Meteo CloudCover.
+
+forecast.py has no Home Assistant imports, so it is loaded by path to keep
+these tests runnable without Home Assistant installed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+FORECAST_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "custom_components"
+    / "open_meteo_cloudcover"
+    / "forecast.py"
+)
+
+_spec = importlib.util.spec_from_file_location("forecast", FORECAST_PATH)
+forecast = importlib.util.module_from_spec(_spec)
+sys.modules.setdefault("forecast", forecast)
+_spec.loader.exec_module(forecast)
+
+BERLIN = ZoneInfo("Europe/Berlin")
+HOURS = 72
+
+
+def _response(first_day: tuple[int, int, int]) -> bytes:
+    """Return 72 hourly values starting at local midnight of first_day."""
+    start = int(datetime(*first_day, tzinfo=BERLIN).timestamp())
+    hourly = {
+        "time": [start + 3600 * hour for hour in range(HOURS)],
+        "cloud_cover": list(range(HOURS)),
+        "is_day": [1] * HOURS,
+    }
+    return json.dumps({"timezone": "Europe/Berlin", "hourly": hourly}).encode()
+
+
+def test_spring_forward_day_has_23_hours() -> None:
+    """The skipped 02:00 hour is absent from the day's hourly data."""
+    now = datetime(2025, 3, 30, 1, 30, tzinfo=BERLIN)
+    result = forecast.process_forecast(_response((2025, 3, 29)), ["cloud_cover"], now)
+
+    today = result["cloud_cover_0"]
+    assert today["date"] == "2025-03-30"
+    assert len(today["hourly_data"]) == 23
+    assert "2025-03-30T02:00" not in today["hourly_data"]
+    assert list(today["hourly_data"])[:3] == [
+        "2025-03-30T00:00",
+        "2025-03-30T01:00",
+        "2025-03-30T03:00",
+    ]
+
+    assert result["_series"].index_at(now.timestamp()) == 25
+    assert result["cloud_cover_this_hour"]["value"] == 25
+    # The next hour is 03:00, the hour after the jump
+    assert result["cloud_cover_next_hour"]["value"] == 26
+
+
+@pytest.mark.parametrize(("fold", "index"), [(0, 26), (1, 27)])
+def test_fall_back_day_has_25_hours(fold: int, index: int) -> None:
+    """Both 02:00 hours are kept, the repeated one labelled with its offset."""
+    now = datetime(2025, 10, 26, 2, 30, tzinfo=BERLIN, fold=fold)
+    result = forecast.process_forecast(
+        _response((2025, 10, 25)), ["cloud_cover"], now
+    )
+
+    today = result["cloud_cover_0"]
+    assert today["date"] == "2025-10-26"
+    assert len(today["hourly_data"]) == 25
+    assert list(today["hourly_data"])[2:4] == [
+        "2025-10-26T02:00",
+        "2025-10-26T02:00+01:00",
+    ]
+
+    assert result["_series"].index_at(now.timestamp()) == index
+    assert result["cloud_cover_this_hour"]["value"] == index
+    assert result["cloud_cover_next_hour"]["value"] == index + 1
+
+
+@pytest.mark.parametrize("low_footprint", [False, True])
+def test_reaggregate_across_fall_back(low_footprint: bool) -> None:
+    """Re-deriving an hour later matches processing the response again."""
+    raw = _response((2025, 10, 25))
+    fetched = datetime(2025, 10, 26, 1, 30, tzinfo=BERLIN)
+    later = datetime(2025, 10, 26, 2, 30, tzinfo=BERLIN, fold=1)
+
+    first = forecast.process_forecast(
+        raw, ["cloud_cover"], fetched, low_footprint=low_footprint
+    )
+    moved = forecast.reaggregate_series(
+        first["_series"], ["cloud_cover"], later, low_footprint=low_footprint
+    )
+    fresh = forecast.process_forecast(
+        raw, ["cloud_cover"], later, low_footprint=low_footprint
+    )
+
+    for key in ("cloud_cover_this_hour", "cloud_cover_next_hour", "cloud_cover_0"):
+        assert moved[key] == fresh[key]